@@ -4,22 +4,28 @@ Application
 ===========
 """
 
-from __future__ import division, unicode_literals
-
-import json
+import gzip
+import hashlib
+import orjson
 import os
-from cachelib import SimpleCache
-from flask import Flask, Response, render_template, request
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache, wraps
+from itertools import product
+from urllib.parse import quote, urlencode
+from flask import Flask, Response, abort, render_template, request
 from flask_caching import Cache
-from flask_compress import Compress
 
+import colour
 from colour.utilities import domain_range_scale
 
 from colour_analysis import (
-    COLOURSPACE_MODEL, IMAGE_COLOURSPACE, IMAGE_CCTF_DECODING,
-    PRIMARY_COLOURSPACE, RGB_colourspaces, RGB_colourspace_volume_visual,
-    RGB_image_scatter_visual, SECONDARY_COLOURSPACE, colourspace_models,
-    cctf_decodings, image_data, pointer_gamut_visual, spectral_locus_visual,
+    COLOURSPACE_MODEL, COLOURSPACE_MODELS, IMAGE_COLOURSPACE,
+    IMAGE_CCTF_DECODING, LINEAR_FILE_FORMATS, PRIMARY_COLOURSPACE,
+    RGB_colourspaces, RGB_colourspace_volume_visual, RGB_image_scatter_visual,
+    SECONDARY_COLOURSPACE, colourspace_models, cctf_decodings, image_data,
+    load_image, pointer_gamut_visual, spectral_locus_visual,
     visible_spectrum_visual)
 
 __author__ = 'Colour Developers'
@@ -41,12 +47,20 @@ __version__ = '.'.join(
 
 
 __all__ = [
-    'APP', 'CACHE', 'CACHE_DEFAULT_TIMEOUT', 'IMAGES_DIRECTORY',
+    'APP', 'CACHE_DEFAULT_TIMEOUT', 'CACHE_KEY_PREFIX', 'REDIS_URL', 'CACHE',
+    'PRECOMPRESS_LEVEL', 'COMPRESS_LEVEL', 'STREAM_CHUNK_SIZE',
+    'IMAGES_DIRECTORY', 'IMAGES_CACHE_TIMEOUT', 'PRECOMPUTED_RESPONSES',
+    'DETERMINISTIC_ENDPOINTS', 'IMAGE_DATA_ARGUMENTS',
+    'RGB_COLOURSPACE_VOLUME_VISUAL_ARGUMENTS',
+    'RGB_IMAGE_SCATTER_VISUAL_ARGUMENTS', 'SPECTRAL_LOCUS_VISUAL_ARGUMENTS',
+    'POINTER_GAMUT_VISUAL_ARGUMENTS', 'VISIBLE_SPECTRUM_VISUAL_ARGUMENTS',
     'images_response', 'cctf_decodings_response',
     'colourspace_models_response', 'RGB_colourspaces_response',
     'image_data_response', 'RGB_colourspace_volume_visual_response',
     'RGB_image_scatter_visual_response', 'spectral_locus_visual_response',
-    'pointer_gamut_visual_response', 'index', 'after_request'
+    'pointer_gamut_visual_response', 'visible_spectrum_visual_response',
+    'index', 'before_request', 'after_request', 'prewarm_cache',
+    'precompute_RGB_colourspace_volume_visuals'
 ]
 
 APP = Flask(__name__)
@@ -56,30 +70,71 @@ APP = Flask(__name__)
 APP : Flask
 """
 
-CACHE = Cache(config={'CACHE_TYPE': 'simple'})
+CACHE_DEFAULT_TIMEOUT = 60 * 24 * 7
+"""
+Cache responses timeout.
+
+CACHE_DEFAULT_TIMEOUT : int
+"""
+
+CACHE_KEY_PREFIX = 'cav1:'
+"""
+Cache keys prefix.
+
+CACHE_KEY_PREFIX : unicode
+"""
+
+REDIS_URL = os.environ.get('REDIS_URL')
+"""
+*Redis* server url used to share the responses cache between the workers and
+across restarts. If undefined, each worker uses its own in-memory cache.
+
+REDIS_URL : unicode
+"""
+
+if REDIS_URL is None:
+    CACHE = Cache(config={'CACHE_TYPE': 'simple'})
+else:
+    CACHE = Cache(
+        config={
+            'CACHE_TYPE': 'redis',
+            'CACHE_REDIS_URL': REDIS_URL,
+            'CACHE_DEFAULT_TIMEOUT': CACHE_DEFAULT_TIMEOUT,
+            'CACHE_KEY_PREFIX': CACHE_KEY_PREFIX,
+        })
 """
 Global application responses cache.
 
 CACHE : Cache
 """
 
-CACHE_DEFAULT_TIMEOUT = 60 * 24 * 7
+CACHE.init_app(APP)
+
+PRECOMPRESS_LEVEL = 9
 """
-Cache responses timeout.
+*gzip* compression level of the precomputed responses, they are compressed
+only once per process thus the highest level is affordable.
 
-CACHE_DEFAULT_TIMEOUT : int
+PRECOMPRESS_LEVEL : int
 """
 
-CACHE.init_app(APP)
+COMPRESS_LEVEL = 3
+"""
+*gzip* compression level of the cached responses, they are compressed on the
+request path on every cache miss, e.g. for every new image arguments, thus a
+fast level is used.
 
-APP.config.update(
-    COMPRESS_LEVEL=3,
-    COMPRESS_CACHE_KEY=lambda x: x.full_path,
-    COMPRESS_CACHE_BACKEND=lambda: SimpleCache(default_timeout=  # noqa
-                                               CACHE_DEFAULT_TIMEOUT),
-)
+COMPRESS_LEVEL : int
+"""
+
+STREAM_CHUNK_SIZE = 16384
+"""
+Size in bytes of the *gzip* compressed data chunks decompressed at once when
+streaming a response to a client not accepting the *gzip* encoding.
+
+STREAM_CHUNK_SIZE : int
+"""
 
-Compress(APP)
 
 IMAGES_DIRECTORY = os.path.join(os.getcwd(), 'static', 'images')
 """
@@ -88,11 +143,47 @@ Images directory.
 IMAGES_DIRECTORY : unicode
 """
 
+IMAGES_CACHE_TIMEOUT = 60
+"""
+Images directory listing cache timeout in seconds.
+
+IMAGES_CACHE_TIMEOUT : int
+"""
+
+PRECOMPUTED_RESPONSES = {
+    'decoding-cctfs': cctf_decodings,
+    'colourspace-models': colourspace_models,
+    'RGB-colourspaces': RGB_colourspaces,
+}
+"""
+Precomputed responses names and the definitions returning their *JSON* data,
+they are compressed in memory on first request.
+
+PRECOMPUTED_RESPONSES : dict
+"""
+
+DETERMINISTIC_ENDPOINTS = ('cctf_decodings_response',
+                           'colourspace_models_response',
+                           'RGB_colourspaces_response',
+                           'RGB_colourspace_volume_visual_response',
+                           'spectral_locus_visual_response',
+                           'pointer_gamut_visual_response',
+                           'visible_spectrum_visual_response')
+"""
+Endpoints whose response is a deterministic function of their query string
+and thus can be revalidated with an *ETag*.
+
+DETERMINISTIC_ENDPOINTS : tuple
+"""
+
 
-def _null_to_None(data):
+_BOOLEANS = {'true': True, 'false': False, True: True, False: False}
+
+
+def _bool_to_bool(data):
     """
-    Converts *Javascript* originated *null* and *undefined* strings
-    to `None`. Non-matching data will be passed untouched.
+    Converts *Javascript* originated *true* and *false* strings
+    to `True` or `False`. Non-matching data will be passed untouched.
 
     Parameters
     ----------
@@ -101,45 +192,497 @@ def _null_to_None(data):
 
     Returns
     -------
-    None or unicode
+    True or False or unicode
         Converted data.
     """
 
-    if data in ('null', 'undefined'):
-        return None
-    else:
-        return data
+    return _BOOLEANS.get(data, data)
 
 
-def _bool_to_bool(data):
+def _parse_args(args, schema):
     """
-    Converts *Javascript* originated *true* and *false* strings
-    to `True` or `False`. Non-matching data will be passed untouched.
+    Parses given request arguments according to given schema, walking the
+    arguments only once, aborts with a *400* error if an argument cannot be
+    parsed.
 
     Parameters
     ----------
-    data : unicode
-        Data to convert.
+    args : MultiDict
+        Request arguments to parse.
+    schema : dict
+        Schema mapping the request arguments names to the keyword argument
+        name, parser and default value triplets.
 
     Returns
     -------
-    True or False or unicode
-        Converted data.
+    dict
+        Parsed keyword arguments.
+    """
+
+    parsed = {
+        keyword: default
+        for keyword, _parser, default in schema.values()
+    }
+    for name, value in args.items():
+        if name in schema:
+            keyword, parser, _default = schema[name]
+            try:
+                parsed[keyword] = parser(value)
+            except ValueError:
+                abort(400)
+
+    return parsed
+
+
+IMAGE_DATA_ARGUMENTS = {
+    'primaryColourspace': ('primary_colourspace', str, PRIMARY_COLOURSPACE),
+    'secondaryColourspace': ('secondary_colourspace', str,
+                             SECONDARY_COLOURSPACE),
+    'imageColourspace': ('image_colourspace', str, IMAGE_COLOURSPACE),
+    'imageDecodingCctf': ('image_decoding_cctf', str, IMAGE_CCTF_DECODING),
+    'outOfPrimaryColourspaceGamut': ('out_of_primary_colourspace_gamut',
+                                     _bool_to_bool, False),
+    'outOfSecondaryColourspaceGamut': ('out_of_secondary_colourspace_gamut',
+                                       _bool_to_bool, False),
+    'outOfPointerGamut': ('out_of_pointer_gamut', _bool_to_bool, False),
+    'saturate': ('saturate', _bool_to_bool, False),
+}
+"""
+Image data request arguments schema.
+
+IMAGE_DATA_ARGUMENTS : dict
+"""
+
+RGB_COLOURSPACE_VOLUME_VISUAL_ARGUMENTS = {
+    'colourspace': ('colourspace', str, PRIMARY_COLOURSPACE),
+    'colourspaceModel': ('colourspace_model', str, COLOURSPACE_MODEL),
+    'segments': ('segments', int, 16),
+    'wireframe': ('wireframe', _bool_to_bool, False),
+}
+"""
+RGB colourspace volume visual request arguments schema.
+
+RGB_COLOURSPACE_VOLUME_VISUAL_ARGUMENTS : dict
+"""
+
+RGB_IMAGE_SCATTER_VISUAL_ARGUMENTS = dict(
+    IMAGE_DATA_ARGUMENTS, **{
+        'colourspaceModel': ('colourspace_model', str, COLOURSPACE_MODEL),
+        'subSampling': ('sub_sampling', int, 25),
+    })
+"""
+RGB image scatter visual request arguments schema.
+
+RGB_IMAGE_SCATTER_VISUAL_ARGUMENTS : dict
+"""
+
+SPECTRAL_LOCUS_VISUAL_ARGUMENTS = {
+    'colourspace': ('colourspace', str, PRIMARY_COLOURSPACE),
+    'colourspaceModel': ('colourspace_model', str, COLOURSPACE_MODEL),
+}
+"""
+Spectral locus visual request arguments schema.
+
+SPECTRAL_LOCUS_VISUAL_ARGUMENTS : dict
+"""
+
+POINTER_GAMUT_VISUAL_ARGUMENTS = {
+    'colourspaceModel': ('colourspace_model', str, COLOURSPACE_MODEL),
+}
+"""
+*Pointer's Gamut* visual request arguments schema.
+
+POINTER_GAMUT_VISUAL_ARGUMENTS : dict
+"""
+
+VISIBLE_SPECTRUM_VISUAL_ARGUMENTS = {
+    'colourspaceModel': ('colourspace_model', str, COLOURSPACE_MODEL),
+}
+"""
+Visible spectrum visual request arguments schema.
+
+VISIBLE_SPECTRUM_VISUAL_ARGUMENTS : dict
+"""
+
+
+@lru_cache(maxsize=1)
+def _listed_images(time_bucket):
+    """
+    Returns the sorted images of the images directory for given time bucket.
+
+    Parameters
+    ----------
+    time_bucket : int
+        Time bucket the images directory listing is cached for.
+
+    Returns
+    -------
+    tuple
+        Sorted images.
     """
 
-    if data == 'true' or data is True:
-        return True
-    elif data == 'false' or data is False:
-        return False
+    return tuple(sorted(os.listdir(IMAGES_DIRECTORY)))
+
+
+def _sorted_images():
+    """
+    Returns the sorted images of the images directory, the listing is cached
+    and refreshed every :attr:`IMAGES_CACHE_TIMEOUT` seconds.
+
+    Returns
+    -------
+    tuple
+        Sorted images.
+    """
+
+    return _listed_images(int(time.time() // IMAGES_CACHE_TIMEOUT))
+
+
+def _image_path(image):
+    """
+    Returns the path of given image in the images directory, aborts with a
+    *404* error if the image does not exist.
+
+    Parameters
+    ----------
+    image : unicode
+        Image name.
+
+    Returns
+    -------
+    unicode
+        Image path.
+    """
+
+    if image not in _sorted_images():
+        abort(404)
+
+    return os.path.join(IMAGES_DIRECTORY, image)
+
+
+def _json_response(json_data):
+    """
+    Returns a response for given *JSON* data.
+
+    The *X-Content-Length* header mirrors the *Content-Length* header set by
+    *Werkzeug* because the latter is replaced by the compressed length, e.g.
+    by the reverse proxy, while the client uses the uncompressed length to
+    report loading progress.
+
+    Parameters
+    ----------
+    json_data : bytes or unicode
+        *JSON* data.
+
+    Returns
+    -------
+    Response
+        *JSON* data response.
+    """
+
+    response = Response(json_data, status=200, mimetype='application/json')
+    response.headers['X-Content-Length'] = response.content_length
+
+    return response
+
+
+def _compress(data, level=COMPRESS_LEVEL):
+    """
+    Compresses given data with *gzip*.
+
+    Parameters
+    ----------
+    data : bytes or unicode
+        Data to compress.
+    level : int, optional
+        *gzip* compression level.
+
+    Returns
+    -------
+    tuple
+        *gzip* compressed data and uncompressed data length.
+    """
+
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+
+    return gzip.compress(data, level), len(data)
+
+
+def _decompress_chunks(compressed_data):
+    """
+    Decompresses given *gzip* compressed data chunk by chunk so that the
+    uncompressed data never needs to be held entirely in memory.
+
+    Parameters
+    ----------
+    compressed_data : bytes
+        *gzip* compressed data.
+
+    Yields
+    ------
+    bytes
+        Uncompressed data chunk.
+    """
+
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    compressed_data = memoryview(compressed_data)
+    for i in range(0, len(compressed_data), STREAM_CHUNK_SIZE):
+        yield decompressor.decompress(compressed_data[i:i + STREAM_CHUNK_SIZE])
+
+    yield decompressor.flush()
+
+
+def _compressed_response(entry):
+    """
+    Returns a *JSON* response for given *gzip* compressed data served as is to
+    the clients accepting the *gzip* encoding.
+
+    Parameters
+    ----------
+    entry : tuple
+        *gzip* compressed data and uncompressed data length as returned by
+        :func:`_compress` definition.
+
+    Returns
+    -------
+    Response
+        *JSON* response.
+    """
+
+    compressed_data, content_length = entry
+
+    # Clients not accepting the *gzip* encoding get the uncompressed data
+    # streamed, the whole uncompressed data is thus never allocated.
+    # A *gzip* encoding with a zero quality is refused rather than accepted.
+    if request.accept_encodings['gzip'] > 0:
+        response = Response(
+            compressed_data, status=200, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
     else:
-        return data
+        response = Response(
+            _decompress_chunks(compressed_data),
+            status=200,
+            mimetype='application/json',
+            direct_passthrough=True)
+        response.headers['Content-Length'] = content_length
+
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['X-Content-Length'] = content_length
+
+    return response
+
+
+@lru_cache(maxsize=None)
+def _precomputed(name):
+    """
+    Returns the *gzip* compressed data of the precomputed response with given
+    name, memoised in-process.
+
+    Parameters
+    ----------
+    name : unicode
+        Precomputed response name.
+
+    Returns
+    -------
+    tuple
+        *gzip* compressed data and uncompressed data length.
+    """
+
+    return _compress(PRECOMPUTED_RESPONSES[name](), PRECOMPRESS_LEVEL)
+
+
+def _precomputed_response(name):
+    """
+    Returns the precomputed response with given name, served with
+    :func:`_compressed_response` definition.
+
+    Parameters
+    ----------
+    name : unicode
+        Precomputed response name.
+
+    Returns
+    -------
+    Response
+        Precomputed response.
+    """
+
+    response = _compressed_response(_precomputed(name))
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+
+    return response
+
+
+def _image_data_key_arguments(arguments, image):
+    """
+    Returns the image data parsed arguments affecting the response.
+
+    Parameters
+    ----------
+    arguments : dict
+        Parsed request arguments.
+    image : unicode
+        Image name.
+
+    Returns
+    -------
+    dict
+        Parsed request arguments affecting the response.
+    """
+
+    arguments = _RGB_image_scatter_visual_key_arguments(arguments, image)
+
+    if not (arguments['out_of_primary_colourspace_gamut'] or
+            arguments['out_of_secondary_colourspace_gamut'] or
+            arguments['out_of_pointer_gamut']):
+        for argument in ('primary_colourspace', 'secondary_colourspace',
+                         'image_colourspace'):
+            arguments.pop(argument)
+
+    return arguments
+
+
+def _RGB_image_scatter_visual_key_arguments(arguments, image):
+    """
+    Returns the RGB image scatter visual parsed arguments affecting the
+    response.
+
+    Parameters
+    ----------
+    arguments : dict
+        Parsed request arguments.
+    image : unicode
+        Image name.
+
+    Returns
+    -------
+    dict
+        Parsed request arguments affecting the response.
+    """
+
+    arguments = dict(arguments)
+
+    if os.path.splitext(image)[-1].lower() in LINEAR_FILE_FORMATS:
+        arguments.pop('image_decoding_cctf')
+
+    return arguments
+
+
+def _cache_key(path, arguments):
+    """
+    Returns the :attr:`CACHE` cache key for given request path and parsed
+    arguments.
+
+    Parameters
+    ----------
+    path : unicode
+        Request path.
+    arguments : dict
+        Parsed request arguments.
+
+    Returns
+    -------
+    unicode
+        Cache key.
+    """
+
+    return '{0}?{1}'.format(path, urlencode(sorted(arguments.items())))
+
+
+def _cached_compressed(schema, key_arguments=None):
+    """
+    Returns a decorator parsing the request arguments once according to given
+    schema and passing them to the decorated view with the ``arguments``
+    keyword argument. The view response is stored *gzip* compressed in the
+    :attr:`CACHE` cache, keyed by the normalised parsed arguments, and served
+    with :func:`_compressed_response` definition.
+
+    Parameters
+    ----------
+    schema : dict
+        Request arguments schema, see :func:`_parse_args` definition.
+    key_arguments : callable, optional
+        Callable returning, from the parsed arguments and the view keyword
+        arguments, only the arguments affecting the response so that the
+        others do not yield distinct cache entries.
+
+    Returns
+    -------
+    callable
+        Decorator.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(**kwargs):
+            arguments = _parse_args(request.args, schema)
+            key = _cache_key(
+                request.path, arguments if key_arguments is None else
+                key_arguments(arguments, **kwargs))
+
+            entry = CACHE.get(key)
+            if entry is None:
+                entry = _compress(
+                    view(arguments=arguments, **kwargs).get_data())
+                CACHE.set(key, entry, timeout=CACHE_DEFAULT_TIMEOUT)
+
+            return _compressed_response(entry)
+
+        return wrapper
+
+    return decorator
+
+
+@lru_cache(maxsize=64)
+def _pointer_gamut_visual(colourspace_model):
+    """
+    Returns the *gzip* compressed *Pointer's Gamut* visual geometry, memoised
+    in-process on the parsed request arguments as it only depends on the
+    colourspace model.
+
+    Parameters
+    ----------
+    colourspace_model : unicode
+        Colourspace model used to generate the visual geometry.
+
+    Returns
+    -------
+    tuple
+        *gzip* compressed visual geometry and its uncompressed length.
+    """
+
+    return _compress(pointer_gamut_visual(colourspace_model=colourspace_model))
+
+
+@lru_cache(maxsize=64)
+def _visible_spectrum_visual(colourspace_model):
+    """
+    Returns the *gzip* compressed visible spectrum visual geometry, memoised
+    in-process on the parsed request arguments as it only depends on the
+    colourspace model.
+
+    Parameters
+    ----------
+    colourspace_model : unicode
+        Colourspace model used to generate the visual geometry.
+
+    Returns
+    -------
+    tuple
+        *gzip* compressed visual geometry and its uncompressed length.
+    """
+
+    return _compress(
+        visible_spectrum_visual(colourspace_model=colourspace_model))
 
 
 @APP.route('/images')
-@CACHE.cached(timeout=CACHE_DEFAULT_TIMEOUT, query_string=True)
 def images_response():
     """
-    Returns the images response.
+    Returns the images response, conditional on an *ETag* derived from the
+    images directory listing.
 
     Returns
     -------
@@ -147,16 +690,15 @@ def images_response():
         Images response.
     """
 
-    json_data = json.dumps(sorted(os.listdir(IMAGES_DIRECTORY)))
+    json_data = orjson.dumps(_sorted_images())
 
-    response = Response(json_data, status=200, mimetype='application/json')
-    response.headers['X-Content-Length'] = len(json_data)
+    response = _json_response(json_data)
+    response.add_etag()
 
-    return response
+    return response.make_conditional(request)
 
 
 @APP.route('/decoding-cctfs')
-@CACHE.cached(timeout=CACHE_DEFAULT_TIMEOUT, query_string=True)
 def cctf_decodings_response():
     """
     Returns the decoding colour component transfer functions response.
@@ -167,16 +709,10 @@ def cctf_decodings_response():
         Decoding colour component transfer functions response.
     """
 
-    json_data = cctf_decodings()
-
-    response = Response(json_data, status=200, mimetype='application/json')
-    response.headers['X-Content-Length'] = len(json_data)
-
-    return response
+    return _precomputed_response('decoding-cctfs')
 
 
 @APP.route('/colourspace-models')
-@CACHE.cached(timeout=CACHE_DEFAULT_TIMEOUT, query_string=True)
 def colourspace_models_response():
     """
     Returns the colourspace models response.
@@ -187,16 +723,10 @@ def colourspace_models_response():
         Colourspace models response.
     """
 
-    json_data = colourspace_models()
-
-    response = Response(json_data, status=200, mimetype='application/json')
-    response.headers['X-Content-Length'] = len(json_data)
-
-    return response
+    return _precomputed_response('colourspace-models')
 
 
 @APP.route('/RGB-colourspaces')
-@CACHE.cached(timeout=CACHE_DEFAULT_TIMEOUT, query_string=True)
 def RGB_colourspaces_response():
     """
     Returns the RGB colourspaces response.
@@ -207,143 +737,103 @@ def RGB_colourspaces_response():
         RGB colourspaces response.
     """
 
-    json_data = RGB_colourspaces()
-
-    response = Response(json_data, status=200, mimetype='application/json')
-    response.headers['X-Content-Length'] = len(json_data)
-
-    return response
+    return _precomputed_response('RGB-colourspaces')
 
 
 @APP.route('/image-data/<image>')
-@CACHE.cached(timeout=CACHE_DEFAULT_TIMEOUT, query_string=True)
-def image_data_response(image):
+@_cached_compressed(IMAGE_DATA_ARGUMENTS, _image_data_key_arguments)
+def image_data_response(image, arguments):
     """
     Returns an image data response.
 
+    Parameters
+    ----------
+    image : unicode
+        Image name.
+    arguments : dict
+        Parsed request arguments.
+
     Returns
     -------
     Response
         Image data response.
     """
 
-    path = os.path.join(os.getcwd(), 'static', 'images', image)
-
-    args = request.args
-    json_data = image_data(
-        path=path,
-        primary_colourspace=args.get('primaryColourspace',
-                                     PRIMARY_COLOURSPACE),
-        secondary_colourspace=args.get('secondaryColourspace',
-                                       SECONDARY_COLOURSPACE),
-        image_colourspace=args.get('imageColourspace', IMAGE_COLOURSPACE),
-        image_decoding_cctf=args.get('imageDecodingCctf', IMAGE_CCTF_DECODING),
-        out_of_primary_colourspace_gamut=_bool_to_bool(
-            args.get('outOfPrimaryColourspaceGamut', False)),
-        out_of_secondary_colourspace_gamut=_bool_to_bool(
-            args.get('outOfSecondaryColourspaceGamut', False)),
-        out_of_pointer_gamut=_bool_to_bool(
-            args.get('outOfPointerGamut', False)),
-        saturate=_bool_to_bool(args.get('saturate', False)))
+    json_data = image_data(path=_image_path(image), **arguments)
 
-    response = Response(json_data, status=200, mimetype='application/json')
-    response.headers['X-Content-Length'] = len(json_data)
-
-    return response
+    return _json_response(json_data)
 
 
 @APP.route('/RGB-colourspace-volume-visual')
-@CACHE.cached(timeout=CACHE_DEFAULT_TIMEOUT, query_string=True)
-def RGB_colourspace_volume_visual_response():
+@_cached_compressed(RGB_COLOURSPACE_VOLUME_VISUAL_ARGUMENTS)
+def RGB_colourspace_volume_visual_response(arguments):
     """
     Returns a RGB colourspace volume visual response.
 
+    Parameters
+    ----------
+    arguments : dict
+        Parsed request arguments.
+
     Returns
     -------
     Response
          RGB colourspace volume visual response.
     """
 
-    args = request.args
-    json_data = RGB_colourspace_volume_visual(
-        colourspace=args.get('colourspace', PRIMARY_COLOURSPACE),
-        colourspace_model=args.get('colourspaceModel', COLOURSPACE_MODEL),
-        segments=int(args.get('segments', 16)),
-        wireframe=_bool_to_bool(args.get('wireframe', False)),
-    )
+    json_data = RGB_colourspace_volume_visual(**arguments)
 
-    response = Response(json_data, status=200, mimetype='application/json')
-    response.headers['X-Content-Length'] = len(json_data)
-
-    return response
+    return _json_response(json_data)
 
 
 @APP.route('/RGB-image-scatter-visual/<image>')
-@CACHE.cached(timeout=CACHE_DEFAULT_TIMEOUT, query_string=True)
-def RGB_image_scatter_visual_response(image):
+@_cached_compressed(RGB_IMAGE_SCATTER_VISUAL_ARGUMENTS,
+                    _RGB_image_scatter_visual_key_arguments)
+def RGB_image_scatter_visual_response(image, arguments):
     """
     Returns a RGB image scatter visual response.
 
+    Parameters
+    ----------
+    image : unicode
+        Image name.
+    arguments : dict
+        Parsed request arguments.
+
     Returns
     -------
     Response
         RGB image scatter visual response.
     """
 
-    path = os.path.join(os.getcwd(), 'static', 'images', image)
-
-    args = request.args
-    json_data = RGB_image_scatter_visual(
-        path=path,
-        primary_colourspace=args.get('primaryColourspace',
-                                     PRIMARY_COLOURSPACE),
-        secondary_colourspace=args.get('secondaryColourspace',
-                                       SECONDARY_COLOURSPACE),
-        image_colourspace=args.get('imageColourspace', IMAGE_COLOURSPACE),
-        image_decoding_cctf=args.get('imageDecodingCctf', IMAGE_CCTF_DECODING),
-        colourspace_model=args.get('colourspaceModel', COLOURSPACE_MODEL),
-        out_of_primary_colourspace_gamut=_bool_to_bool(
-            args.get('outOfPrimaryColourspaceGamut', False)),
-        out_of_secondary_colourspace_gamut=_bool_to_bool(
-            args.get('outOfSecondaryColourspaceGamut', False)),
-        out_of_pointer_gamut=_bool_to_bool(
-            args.get('outOfPointerGamut', False)),
-        sub_sampling=int(args.get('subSampling', 25)),
-        saturate=_bool_to_bool(args.get('saturate', False)),
-    )
-
-    response = Response(json_data, status=200, mimetype='application/json')
-    response.headers['X-Content-Length'] = len(json_data)
+    json_data = RGB_image_scatter_visual(path=_image_path(image), **arguments)
 
-    return response
+    return _json_response(json_data)
 
 
 @APP.route('/spectral-locus-visual')
-@CACHE.cached(timeout=CACHE_DEFAULT_TIMEOUT, query_string=True)
-def spectral_locus_visual_response():
+@_cached_compressed(SPECTRAL_LOCUS_VISUAL_ARGUMENTS)
+def spectral_locus_visual_response(arguments):
     """
     Returns a spectral locus visual response.
 
+    Parameters
+    ----------
+    arguments : dict
+        Parsed request arguments.
+
     Returns
     -------
     Response
         Spectral locus visual response.
     """
 
-    args = request.args
-    json_data = spectral_locus_visual(
-        colourspace=args.get('colourspace', PRIMARY_COLOURSPACE),
-        colourspace_model=args.get('colourspaceModel', COLOURSPACE_MODEL),
-    )
+    json_data = spectral_locus_visual(**arguments)
 
-    response = Response(json_data, status=200, mimetype='application/json')
-    response.headers['X-Content-Length'] = len(json_data)
-
-    return response
+    return _json_response(json_data)
 
 
 @APP.route('/pointer-gamut-visual')
-@CACHE.cached(timeout=CACHE_DEFAULT_TIMEOUT, query_string=True)
 def pointer_gamut_visual_response():
     """
     Returns a *Pointer's Gamut* visual response.
@@ -354,18 +844,12 @@ def pointer_gamut_visual_response():
         *Pointer's Gamut* visual response.
     """
 
-    args = request.args
-    json_data = pointer_gamut_visual(
-        colourspace_model=args.get('colourspaceModel', COLOURSPACE_MODEL), )
-
-    response = Response(json_data, status=200, mimetype='application/json')
-    response.headers['X-Content-Length'] = len(json_data)
+    arguments = _parse_args(request.args, POINTER_GAMUT_VISUAL_ARGUMENTS)
 
-    return response
+    return _compressed_response(_pointer_gamut_visual(**arguments))
 
 
 @APP.route('/visible-spectrum-visual')
-@CACHE.cached(timeout=CACHE_DEFAULT_TIMEOUT, query_string=True)
 def visible_spectrum_visual_response():
     """
     Returns the visible spectrum visual response.
@@ -376,14 +860,9 @@ def visible_spectrum_visual_response():
         visible spectrum visual response.
     """
 
-    args = request.args
-    json_data = visible_spectrum_visual(
-        colourspace_model=args.get('colourspaceModel', COLOURSPACE_MODEL), )
-
-    response = Response(json_data, status=200, mimetype='application/json')
-    response.headers['X-Content-Length'] = len(json_data)
+    arguments = _parse_args(request.args, VISIBLE_SPECTRUM_VISUAL_ARGUMENTS)
 
-    return response
+    return _compressed_response(_visible_spectrum_visual(**arguments))
 
 
 @APP.route('/')
@@ -401,7 +880,7 @@ def index():
         'index.html',
         colour_analysis_js=os.environ.get('COLOUR_ANALYSIS_JS',
                                           '/static/js/colour-analysis.js'),
-        image=sorted(os.listdir(IMAGES_DIRECTORY))[0],
+        image=_sorted_images()[0],
         primary_colourspace=PRIMARY_COLOURSPACE,
         secondary_colourspace=SECONDARY_COLOURSPACE,
         image_colourspace=IMAGE_COLOURSPACE,
@@ -409,8 +888,74 @@ def index():
         colourspace_model=COLOURSPACE_MODEL)
 
 
+def _etag():
+    """
+    Returns the *ETag* of the response of a deterministic endpoint to the
+    current request.
+
+    The *ETag* only depends on the request full path, the application and
+    *Colour* versions and the negotiated encoding, it is thus known before
+    the view is called.
+
+    Returns
+    -------
+    unicode
+        *ETag*.
+    """
+
+    content_encoding = 'gzip' if request.accept_encodings['gzip'] > 0 else None
+
+    return hashlib.blake2b(
+        '{0}-{1}-{2}-{3}'.format(request.full_path, __version__,
+                                 colour.__version__,
+                                 content_encoding).encode('utf-8'),
+        digest_size=16).hexdigest()
+
+
+@APP.before_request
+def before_request():
+    """
+    Returns a *304* response to the conditional requests of the deterministic
+    endpoints whose *ETag* matches, without calling the view and thus without
+    recomputing a response evicted from the :attr:`CACHE` cache.
+
+    Returns
+    -------
+    Response or None
+        *304* response or *None* to let the view handle the request.
+    """
+
+    if request.endpoint not in DETERMINISTIC_ENDPOINTS:
+        return None
+
+    etag = _etag()
+    if etag in request.if_none_match:
+        response = Response(status=304)
+        response.set_etag(etag)
+        response.headers['Vary'] = 'Accept-Encoding'
+
+        return response
+
+    return None
+
+
 @APP.after_request
 def after_request(response):
+    """
+    Adds the *CORS* headers to given response and makes the responses of the
+    deterministic endpoints conditional on their *ETag*.
+
+    Parameters
+    ----------
+    response : Response
+        Response to add the *CORS* headers to.
+
+    Returns
+    -------
+    Response
+        Response with the *CORS* headers.
+    """
+
     response.headers.add('Access-Control-Allow-Origin', '*')
     response.headers.add('Access-Control-Allow-Headers',
                          'Content-Type,Authorization')
@@ -418,9 +963,145 @@ def after_request(response):
                          'GET,PUT,POST,DELETE,OPTIONS')
     response.headers.add('Access-Control-Expose-Headers', 'X-Content-Length')
 
+    if (response.status_code == 200 and
+            request.endpoint in DETERMINISTIC_ENDPOINTS):
+        response.set_etag(_etag())
+        response = response.make_conditional(request)
+
     return response
 
 
+def prewarm_cache(responses=True):
+    """
+    Requests the responses for the default parameters so that they are cached
+    before the first client request.
+
+    Parameters
+    ----------
+    responses : bool, optional
+        Whether to pre-warm the :attr:`CACHE` responses cache, otherwise only
+        the decoded images cache of the default image is pre-warmed. The
+        responses cache of another process is only useful if it is shared,
+        i.e. if :attr:`REDIS_URL` is defined.
+    """
+
+    image = _sorted_images()[0]
+
+    if not responses:
+        load_image(os.path.join(IMAGES_DIRECTORY, image), IMAGE_CCTF_DECODING)
+
+        return
+
+    image_parameters = {
+        'primaryColourspace': PRIMARY_COLOURSPACE,
+        'secondaryColourspace': SECONDARY_COLOURSPACE,
+        'imageColourspace': IMAGE_COLOURSPACE,
+        'imageDecodingCctf': IMAGE_CCTF_DECODING,
+        'outOfPrimaryColourspaceGamut': 'false',
+        'outOfSecondaryColourspaceGamut': 'false',
+        'outOfPointerGamut': 'false',
+        'saturate': 'false',
+    }
+    routes = [
+        ('/RGB-colourspace-volume-visual', {
+            'colourspace': PRIMARY_COLOURSPACE,
+            'colourspaceModel': COLOURSPACE_MODEL,
+            'segments': 16,
+            'wireframe': 'false',
+        }),
+        ('/RGB-colourspace-volume-visual', {
+            'colourspace': SECONDARY_COLOURSPACE,
+            'colourspaceModel': COLOURSPACE_MODEL,
+            'segments': 16,
+            'wireframe': 'true',
+        }),
+        ('/spectral-locus-visual', {
+            'colourspace': PRIMARY_COLOURSPACE,
+            'colourspaceModel': COLOURSPACE_MODEL,
+        }),
+        ('/pointer-gamut-visual', {
+            'colourspaceModel': COLOURSPACE_MODEL,
+        }),
+        ('/visible-spectrum-visual', {
+            'colourspaceModel': COLOURSPACE_MODEL,
+        }),
+        ('/image-data/{0}'.format(quote(image)), image_parameters),
+        ('/RGB-image-scatter-visual/{0}'.format(quote(image)),
+         dict(image_parameters, colourspaceModel=COLOURSPACE_MODEL,
+              subSampling=25)),
+    ]
+
+    with APP.test_client() as client:
+        for route, parameters in routes:
+            client.get('{0}?{1}'.format(route, urlencode(parameters)))
+
+
+def precompute_RGB_colourspace_volume_visuals(
+        colourspaces=(PRIMARY_COLOURSPACE, SECONDARY_COLOURSPACE),
+        colourspace_models=COLOURSPACE_MODELS,
+        segments=(16, ),
+        wireframes=(False, True),
+        max_workers=None):
+    """
+    Precomputes the RGB colourspace volume visuals for the cartesian product
+    of given parameters with a process pool and stores them in the
+    :attr:`CACHE` cache. The visuals already cached are skipped.
+
+    Parameters
+    ----------
+    colourspaces : array_like, optional
+        RGB colourspaces to precompute the visuals for.
+    colourspace_models : array_like, optional
+        Colourspace models to precompute the visuals for.
+    segments : array_like, optional
+        Segments counts to precompute the visuals for.
+    wireframes : array_like, optional
+        Wireframe states to precompute the visuals for.
+    max_workers : int, optional
+        Maximum number of processes, defaults to the number of processors
+        minus one.
+
+    Returns
+    -------
+    int
+        Precomputed visuals count.
+    """
+
+    if max_workers is None:
+        max_workers = max((os.cpu_count() or 1) - 1, 1)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for colourspace, colourspace_model, segments_count in product(
+                colourspaces, colourspace_models, segments):
+            arguments = {
+                'colourspace': colourspace,
+                'colourspace_model': colourspace_model,
+                'segments': segments_count,
+            }
+            # The geometry does not depend on the wireframe state, it is
+            # computed once and cached for all the states.
+            keys = []
+            for wireframe in wireframes:
+                key = _cache_key('/RGB-colourspace-volume-visual',
+                                 dict(arguments, wireframe=wireframe))
+                if CACHE.get(key) is None:
+                    keys.append(key)
+
+            if keys:
+                futures[executor.submit(RGB_colourspace_volume_visual,
+                                        **arguments)] = keys
+
+        count = 0
+        for future in as_completed(futures):
+            entry = _compress(future.result())
+            for key in futures[future]:
+                CACHE.set(key, entry, timeout=CACHE_DEFAULT_TIMEOUT)
+                count += 1
+
+    return count
+
+
 if __name__ == '__main__':
     with domain_range_scale(1):
         APP.run()
@@ -7,22 +7,26 @@ Defines various objects that typically output the geometry as JSON to be
 loaded by "Three.js".
 """
 
+import glob
+import hashlib
 import json
 import numpy as np
+import orjson
 import os
 import re
+import tempfile
 from cachelib import SimpleCache
+from functools import lru_cache, partial
 
 from colour import (CCS_ILLUMINANTS, CCTF_DECODINGS, Lab_to_XYZ, LCHab_to_Lab,
-                    RGB_COLOURSPACES, RGB_to_RGB, RGB_to_XYZ, XYZ_to_RGB,
-                    XYZ_to_JzAzBz, XYZ_to_OSA_UCS, convert,
-                    is_within_pointer_gamut, read_image)
+                    MSDS_CMFS, RGB_COLOURSPACES, XYZ_to_JzAzBz,
+                    XYZ_to_OSA_UCS, convert, is_within_pointer_gamut,
+                    matrix_RGB_to_RGB, read_image)
 from colour.geometry import primitive_cube
 from colour.models import (CCS_ILLUMINANT_POINTER_GAMUT,
                            DATA_POINTER_GAMUT_VOLUME, linear_function)
 from colour.plotting import filter_cmfs, filter_RGB_colourspaces
-from colour.utilities import (as_float_array, first_item, normalise_maximum,
-                              tsplit, tstack)
+from colour.utilities import as_float_array, first_item, normalise_maximum
 from colour.volume import XYZ_outer_surface
 
 __author__ = 'Colour Developers'
@@ -33,11 +37,15 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'LINEAR_FILE_FORMATS', 'DTYPE_POSITION', 'DTYPE_COLOUR',
-    'COLOURSPACE_MODELS', 'COLOURSPACE_MODEL_LABELS', 'PRIMARY_COLOURSPACE',
+    'LINEAR_FILE_FORMATS', 'INTEGER_FILE_FORMATS', 'DTYPE_POSITION',
+    'DTYPE_COLOUR', 'COLOURSPACE_MODELS', 'COLOURSPACE_MODEL_LABELS',
+    'COLOURSPACE_MODELS_LINEAR_MATRICES',
+    'COLOURSPACE_MODELS_NORMALISATION_FACTORS',
+    'COLOURSPACE_MODELS_AXIS_ORDER', 'PRIMARY_COLOURSPACE',
     'SECONDARY_COLOURSPACE', 'IMAGE_COLOURSPACE', 'IMAGE_CCTF_DECODING',
-    'COLOURSPACE_MODEL', 'IMAGE_CACHE', 'load_image',
-    'XYZ_to_colourspace_model', 'colourspace_model_axis_reorder',
+    'COLOURSPACE_MODEL', 'RAW_IMAGE_CACHE', 'IMAGE_CACHE_DIRECTORY',
+    'VISUAL_CACHE', 'load_image', 'XYZ_to_colourspace_model',
+    'RGB_to_colourspace_model', 'colourspace_model_axis_reorder',
     'colourspace_model_faces_reorder', 'cctf_decodings', 'colourspace_models',
     'RGB_colourspaces', 'buffer_geometry', 'conform_primitive_dtype',
     'image_data', 'RGB_colourspace_volume_visual', 'spectral_locus_visual',
@@ -52,6 +60,14 @@ Assumed linear image formats.
 LINEAR_IMAGE_FORMATS : tuple
 """
 
+INTEGER_FILE_FORMATS = ('.jpeg', '.jpg', '.png')
+"""
+Image formats whose pixels are always stored as integers, they are read as
+*uint16* and decoded with a look-up table.
+
+INTEGER_FILE_FORMATS : tuple
+"""
+
 DTYPE_POSITION = np.sctypeDict.get(
     os.environ.get('COLOUR_SCIENCE__COLOUR_ANALYSIS_DTYPE_POSITION',
                    'float32'))
@@ -124,8 +140,89 @@ COLOURSPACE_MODELS : dict
     'hdr-CIELAB', 'hdr-IPT'}**
 """
 
+COLOURSPACE_MODELS_LINEAR_MATRICES = {
+    'CIE XYZ': np.identity(3),
+    'CIE UCS': np.array([
+        [2 / 3, 0, 0],
+        [0, 1, 0],
+        [-1 / 2, 3 / 2, 1 / 2],
+    ]),
+}
+"""
+Matrices of the reference colourspace models that are a linear transformation
+of *CIE XYZ* tristimulus values.
+
+COLOURSPACE_MODELS_LINEAR_MATRICES : dict
+    **{'CIE XYZ', 'CIE UCS'}**
+"""
+
+COLOURSPACE_MODELS_NORMALISATION_FACTORS = {
+    'JzAzBz': XYZ_to_JzAzBz([1, 1, 1])[0],
+    'OSA UCS': XYZ_to_OSA_UCS([1, 1, 1])[0],
+}
+"""
+Normalisation factors, for visual convenience, of the reference colourspace
+models whose values are otherwise not of the same scale as the other
+models.
+
+COLOURSPACE_MODELS_NORMALISATION_FACTORS : dict
+    **{'JzAzBz', 'OSA UCS'}**
+"""
+
+COLOURSPACE_MODELS_AXIS_ORDER = {
+    'CIE XYZ': [2, 1, 0],
+    'CIE UCS': [1, 2, 0],
+    'CIE UVW': [1, 2, 0],
+    'CIE xyY': [1, 2, 0],
+}
+COLOURSPACE_MODELS_AXIS_ORDER.update({
+    model: [2, 0, 1]
+    for model in ('CAM02LCD', 'CAM02SCD', 'CAM02UCS', 'CAM16LCD', 'CAM16SCD',
+                  'CAM16UCS', 'CIE Lab', 'CIE LCHab', 'CIE Luv', 'CIE LCHuv',
+                  'DIN 99', 'Hunter Lab', 'Hunter Rdab', 'ICTCP', 'IGPGTG',
+                  'IPT', 'JzAzBz', 'OSA UCS', 'hdr-CIELAB', 'hdr-IPT')
+})
+"""
+Reference colourspace models axes order so that luminance is on *Y* axis, the
+models not listed are left untouched.
+
+COLOURSPACE_MODELS_AXIS_ORDER : dict
+"""
+
+
+def _gamma_decoding(V, exponent):
+    """
+    Decodes given :math:`V` values with given gamma exponent.
+
+    Contrary to *colour.gamma_function* definition, floating point values are
+    not promoted to *float64* so that a *float32* image is decoded with half
+    the memory traffic.
+
+    Parameters
+    ----------
+    V : array_like
+        Encoded values.
+    exponent : numeric
+        Gamma exponent.
+
+    Returns
+    -------
+    ndarray
+        Decoded values.
+    """
+
+    V = np.asarray(V)
+    if not np.issubdtype(V.dtype, np.floating):
+        V = as_float_array(V)
+
+    return np.power(V, V.dtype.type(exponent))
+
+
 CCTF_DECODINGS.update({
     'Linear': linear_function,
+    'Gamma 2.2': partial(_gamma_decoding, exponent=2.2),
+    'Gamma 2.4': partial(_gamma_decoding, exponent=2.4),
+    'Gamma 2.6': partial(_gamma_decoding, exponent=2.6),
 })
 
 PRIMARY_COLOURSPACE = 'sRGB'
@@ -175,18 +272,130 @@ Pointer's Gamut data converted to *CIE XYZ* tristimulus values.
 DATA_POINTER_GAMUT : ndarray
 """
 
-IMAGE_CACHE = SimpleCache(default_timeout=60 * 24 * 7)
+RAW_IMAGE_CACHE = SimpleCache(threshold=4, default_timeout=60 * 24 * 7)
 """
-Server side cache for images.
+Server side cache for the undecoded images, bounded to a few entries as they
+are large.
 
-IMAGE_CACHE : SimpleCache
+RAW_IMAGE_CACHE : SimpleCache
 """
 
+IMAGE_CACHE_DIRECTORY = os.environ.get(
+    'COLOUR_SCIENCE__COLOUR_ANALYSIS_IMAGE_CACHE_DIRECTORY',
+    os.path.join(tempfile.gettempdir(), 'colour-analysis-images'))
+"""
+Server side cache directory for the decoded images, they are stored as *.npy*
+files and memory-mapped so that the operating system page cache is shared
+between the workers. A single file is kept per image and decoding CCTF.
+
+IMAGE_CACHE_DIRECTORY : unicode
+"""
+
+VISUAL_CACHE = SimpleCache(default_timeout=60 * 24 * 7)
+"""
+Server side cache for the deterministic visuals geometry.
+
+VISUAL_CACHE : SimpleCache
+"""
+
+_CCTF_DECODINGS_JSON = json.dumps(list(CCTF_DECODINGS.keys()))
+"""
+Decoding colour component transfer functions formatted as *JSON*.
+
+_CCTF_DECODINGS_JSON : unicode
+"""
+
+_COLOURSPACE_MODELS_JSON = json.dumps(COLOURSPACE_MODEL_LABELS)
+"""
+Colourspace models formatted as *JSON*.
+
+_COLOURSPACE_MODELS_JSON : unicode
+"""
+
+_RGB_COLOURSPACES_JSON = json.dumps(list(RGB_COLOURSPACES.keys()))
+"""
+RGB colourspaces formatted as *JSON*.
+
+_RGB_COLOURSPACES_JSON : unicode
+"""
+
+
+def _read_image(path, mtime):
+    """
+    Reads the image at given path and caches it, undecoded, in
+    `RAW_IMAGE_CACHE` cache so that it can be decoded with different settings
+    without being read again.
+
+    The images with a format listed in `INTEGER_FILE_FORMATS` are read as
+    *uint16*, which losslessly represents both 8-bit and 16-bit pixels.
+
+    Parameters
+    ----------
+    path : unicode
+        Image path.
+    mtime : int
+        Image modification time in nanoseconds.
+
+    Returns
+    -------
+    ndarray
+        Image as a ndarray.
+    """
+
+    key = '{0}-{1}'.format(path, mtime)
 
-def load_image(path, decoding_cctf='sRGB'):
+    RGB = RAW_IMAGE_CACHE.get(key)
+    if RGB is None:
+        is_integer_image = (
+            os.path.splitext(path)[-1].lower() in INTEGER_FILE_FORMATS)
+
+        RGB = read_image(path, 'uint16' if is_integer_image else 'float32')
+
+        RAW_IMAGE_CACHE.set(key, RGB)
+
+    return RGB
+
+
+@lru_cache(maxsize=16)
+def _decoding_LUT(decoding_cctf):
     """
-    Loads the image at given path and caches it in `IMAGE_CACHE` cache. If the
-    image is already cached, it is returned directly.
+    Returns the look-up table decoding the *uint16* code values with given
+    decoding colour component transfer function.
+
+    Parameters
+    ----------
+    decoding_cctf : unicode
+        Decoding colour component transfer function (Decoding CCTF) /
+        electro-optical transfer function (EOTF / EOCF) that maps an
+        :math:`R'G'B'` video component signal value to tristimulus values at
+        the display.
+
+    Returns
+    -------
+    ndarray
+        Read-only look-up table of *float32* dtype.
+    """
+
+    LUT = CCTF_DECODINGS[decoding_cctf](np.linspace(0, 1, 65536))
+    LUT = LUT.astype(np.float32)
+    LUT.setflags(write=False)
+
+    return LUT
+
+
+def load_image(path, decoding_cctf='sRGB', sub_sampling=None):
+    """
+    Loads the image at given path and caches it in `IMAGE_CACHE_DIRECTORY`
+    directory. If the image is already cached and has not been modified since,
+    it is returned directly as a read-only memory-mapped array.
+
+    The image is stored with *float32* dtype so that the gamut tests are
+    performed at full precision, the colours are only cast to `DTYPE_COLOUR`
+    dtype precision when output.
+
+    Only the full decoded image is cached, once per decoding CCTF, and the
+    cached images of a previous modification time are deleted so that the
+    cache directory does not grow with the requests.
 
     Parameters
     ----------
@@ -197,30 +406,125 @@ def load_image(path, decoding_cctf='sRGB'):
         electro-optical transfer function (EOTF / EOCF) that maps an
         :math:`R'G'B'` video component signal value to tristimulus values at
         the display.
+    sub_sampling : int, optional
+        If given, the decoded image pixels are flattened to an array of shape
+        (N, 3) and only every ``sub_sampling`` pixels are kept, in a
+        contiguous copy.
 
     Returns
     -------
     ndarray
-        Image as a ndarray.
+        Image as a ndarray of *float32* dtype.
     """
 
     is_linear_image = os.path.splitext(path)[-1].lower() in LINEAR_FILE_FORMATS
 
     key = path if is_linear_image else '{0}-{1}'.format(path, decoding_cctf)
+    prefix = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
 
-    RGB = IMAGE_CACHE.get(key)
-    if RGB is None:
-        RGB = read_image(path)
+    mtime = os.stat(path).st_mtime_ns
+    cache_path = os.path.join(IMAGE_CACHE_DIRECTORY, '{0}-{1}.npy'.format(
+        prefix, mtime))
 
-        if not is_linear_image:
+    if os.path.exists(cache_path):
+        RGB = np.load(cache_path, mmap_mode='r')
+    else:
+        RGB = _read_image(path, mtime)
+
+        if RGB.dtype == np.uint16:
+            RGB = np.take(_decoding_LUT(decoding_cctf), RGB)
+        elif not is_linear_image:
             RGB = CCTF_DECODINGS[decoding_cctf](RGB)
 
-        IMAGE_CACHE.set(key, RGB)
+        RGB = np.ascontiguousarray(RGB, dtype=np.float32)
+
+        os.makedirs(IMAGE_CACHE_DIRECTORY, exist_ok=True)
+        # The array is written to a process specific temporary path, then
+        # moved, so that concurrent workers never load a partial file.
+        temporary_path = '{0}.{1}'.format(cache_path, os.getpid())
+        with open(temporary_path, 'wb') as npy_file:
+            np.save(npy_file, RGB)
+        os.replace(temporary_path, cache_path)
+
+        for stale_path in glob.glob(
+                os.path.join(IMAGE_CACHE_DIRECTORY, '{0}-*.npy'.format(
+                    prefix))):
+            if stale_path != cache_path:
+                try:
+                    os.remove(stale_path)
+                except FileNotFoundError:
+                    # Removed concurrently by another worker.
+                    pass
+
+    # The sub-sampled pixels are copied into a contiguous array rather than
+    # returned as a strided view for the downstream matrix multiplications and
+    # comparisons. With the pixels being smaller than a page, all the pages of
+    # the memory-mapped array are still read.
+    if sub_sampling is not None:
+        RGB = np.ascontiguousarray(
+            RGB[..., 0:3].reshape(-1, 3)[::sub_sampling])
 
     return RGB
 
 
-def XYZ_to_colourspace_model(XYZ, illuminant, model, **kwargs):
+@lru_cache(maxsize=128)
+def _RGB_colourspace(name):
+    """
+    Returns the first RGB colourspace matching given name.
+
+    Exact names are looked up directly, other names are matched with
+    *colour.plotting.filter_RGB_colourspaces* definition.
+
+    Parameters
+    ----------
+    name : unicode
+        RGB colourspace name.
+
+    Returns
+    -------
+    RGB_Colourspace
+        RGB colourspace.
+    """
+
+    colourspace = RGB_COLOURSPACES.get(name)
+    if colourspace is not None:
+        return colourspace
+
+    return first_item(filter_RGB_colourspaces(re.escape(name)).values())
+
+
+@lru_cache(maxsize=128)
+def _cmfs(name):
+    """
+    Returns the first standard observer colour matching functions matching
+    given name.
+
+    Exact names are looked up directly, other names are matched with
+    *colour.plotting.filter_cmfs* definition.
+
+    Parameters
+    ----------
+    name : unicode
+        Standard observer colour matching functions name.
+
+    Returns
+    -------
+    XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    """
+
+    cmfs = MSDS_CMFS.get(name)
+    if cmfs is not None:
+        return cmfs
+
+    return first_item(filter_cmfs(name).values())
+
+
+def XYZ_to_colourspace_model(XYZ,
+                             illuminant,
+                             model,
+                             reorder_axes=False,
+                             **kwargs):
     """
     Converts from *CIE XYZ* tristimulus values to given colourspace model while
     normalising for visual convenience some of the models.
@@ -238,6 +542,10 @@ def XYZ_to_colourspace_model(XYZ, illuminant, model, **kwargs):
         'CIE UVW', 'DIN 99', 'Hunter Lab', 'Hunter Rdab', 'ICTCP', 'IGPGTG',
         'IPT', 'JzAzBz', 'OSA UCS', 'hdr-CIELAB', 'hdr-IPT'}**,
         Colourspace model to convert the *CIE XYZ* tristimulus values to.
+    reorder_axes : bool, optional
+        Whether to reorder the axes of the colourspace model values so that
+        luminance is on *Y* axis, see `colourspace_model_axis_reorder`
+        definition.
 
     Other Parameters
     ----------------
@@ -258,14 +566,93 @@ def XYZ_to_colourspace_model(XYZ, illuminant, model, **kwargs):
         verbose={'mode': 'Short'},
         **kwargs)
 
-    if model == 'JzAzBz':
-        ijk /= XYZ_to_JzAzBz([1, 1, 1])[0]
-    elif model == 'OSA UCS':
-        ijk /= XYZ_to_OSA_UCS([1, 1, 1])[0]
+    # The reordered copy, if any, is normalised in place.
+    if reorder_axes:
+        ijk = colourspace_model_axis_reorder(ijk, model)
+
+    factor = COLOURSPACE_MODELS_NORMALISATION_FACTORS.get(model)
+    if factor is not None:
+        ijk /= factor
 
     return ijk
 
 
+def RGB_to_colourspace_model(RGB, colourspace, model, reorder_axes=False):
+    """
+    Converts from given RGB colourspace values to given colourspace model.
+
+    For the colourspace models that are a linear transformation of *CIE XYZ*
+    tristimulus values, the *RGB* to *CIE XYZ* matrix is combined with the
+    model matrix so that a single matrix multiplication is performed, the axes
+    reordering being folded into the matrix too. The *CIE xyY* colourspace
+    projection is computed inline.
+
+    Parameters
+    ----------
+    RGB : array_like
+        RGB colourspace values.
+    colourspace : RGB_Colourspace
+        RGB colourspace of the values.
+    model : unicode
+        **{'CAM02LCD', 'CAM02SCD', 'CAM02UCS', 'CAM16LCD', 'CAM16SCD',
+        'CAM16UCS', 'CIE XYZ', 'CIE xyY', 'CIE Lab', 'CIE Luv', 'CIE UCS',
+        'CIE UVW', 'DIN 99', 'Hunter Lab', 'Hunter Rdab', 'ICTCP', 'IGPGTG',
+        'IPT', 'JzAzBz', 'OSA UCS', 'hdr-CIELAB', 'hdr-IPT'}**,
+        Colourspace model to convert the RGB colourspace values to.
+    reorder_axes : bool, optional
+        Whether to reorder the axes of the colourspace model values so that
+        luminance is on *Y* axis, see `colourspace_model_axis_reorder`
+        definition.
+
+    Returns
+    -------
+    ndarray
+        Colourspace model values.
+    """
+
+    RGB = np.asarray(RGB)
+    # The linear and *CIE xyY* values are directly returned and computed in
+    # single precision, unless the input is wider, for a faster *BLAS* path.
+    dtype = np.promote_types(RGB.dtype, np.float32)
+
+    matrix = COLOURSPACE_MODELS_LINEAR_MATRICES.get(model)
+    if matrix is not None:
+        matrix = np.dot(matrix, colourspace.matrix_RGB_to_XYZ)
+
+        # Reordering the matrix rows reorders the converted values axes.
+        axis_order = COLOURSPACE_MODELS_AXIS_ORDER.get(model)
+        if reorder_axes and axis_order is not None:
+            matrix = matrix[axis_order]
+
+        return np.dot(RGB.astype(dtype, copy=False), matrix.T.astype(dtype))
+
+    if model != 'CIE xyY':
+        dtype = np.float64
+
+    # The RGB colourspace and CIE XYZ whitepoints are the same, thus no
+    # chromatic adaptation is required.
+    XYZ = np.dot(
+        RGB.astype(dtype, copy=False),
+        colourspace.matrix_RGB_to_XYZ.T.astype(dtype))
+
+    if model == 'CIE xyY':
+        X_Y_Z = np.sum(XYZ, axis=-1)[..., np.newaxis]
+        is_black = X_Y_Z == 0
+        xy = np.where(is_black, colourspace.whitepoint.astype(dtype),
+                      XYZ[..., 0:2] / np.where(is_black, 1, X_Y_Z))
+
+        xyY = [xy[..., 0:1], xy[..., 1:2], XYZ[..., 1:2]]
+
+        # The axes are directly assembled in the reordered order.
+        if reorder_axes:
+            xyY = [xyY[i] for i in COLOURSPACE_MODELS_AXIS_ORDER[model]]
+
+        return np.concatenate(xyY, axis=-1)
+
+    return XYZ_to_colourspace_model(
+        XYZ, colourspace.whitepoint, model, reorder_axes=reorder_axes)
+
+
 def colourspace_model_axis_reorder(a, model=None):
     """
     Reorder the axes of given colourspace model :math:`a` array so that
@@ -288,16 +675,9 @@ def colourspace_model_axis_reorder(a, model=None):
         Reordered colourspace model :math:`a` array.
     """
 
-    i, j, k = tsplit(a)
-    if model in ('CIE XYZ', ):
-        a = tstack([k, j, i])
-    elif model in ('CIE UCS', 'CIE UVW', 'CIE xyY'):
-        a = tstack([j, k, i])
-    elif model in ('CAM02LCD', 'CAM02SCD', 'CAM02UCS', 'CAM16LCD', 'CAM16SCD',
-                   'CAM16UCS', 'CIE Lab', 'CIE LCHab', 'CIE Luv', 'CIE LCHuv',
-                   'DIN 99', 'Hunter Lab', 'Hunter Rdab', 'ICTCP', 'IGPGTG',
-                   'IPT', 'JzAzBz', 'OSA UCS', 'hdr-CIELAB', 'hdr-IPT'):
-        a = tstack([k, i, j])
+    axis_order = COLOURSPACE_MODELS_AXIS_ORDER.get(model)
+    if axis_order is not None:
+        a = as_float_array(a)[..., axis_order]
 
     return a
 
@@ -340,7 +720,7 @@ def cctf_decodings():
         Decoding colour component transfer functions formatted as *JSON*.
     """
 
-    return json.dumps(list(CCTF_DECODINGS.keys()))
+    return _CCTF_DECODINGS_JSON
 
 
 def colourspace_models():
@@ -353,7 +733,7 @@ def colourspace_models():
         Colourspace models formatted as *JSON*.
     """
 
-    return json.dumps(COLOURSPACE_MODEL_LABELS)
+    return _COLOURSPACE_MODELS_JSON
 
 
 def RGB_colourspaces():
@@ -366,7 +746,7 @@ def RGB_colourspaces():
         RGB colourspaces formatted as *JSON*.
     """
 
-    return json.dumps(list(RGB_COLOURSPACES.keys()))
+    return _RGB_COLOURSPACES_JSON
 
 
 def buffer_geometry(**kwargs):
@@ -383,7 +763,7 @@ BufferGeometryLoader>`__.
 
     Returns
     -------
-    unicode
+    bytes
         Geometry formatted as *JSON*.
     """
 
@@ -402,6 +782,7 @@ BufferGeometryLoader>`__.
         'float16': 'Float32Array',  # Unsupported, casted up.
         'float32': 'Float32Array',
         'float64': 'Float32Array',  # Unsupported, casted down.
+        'uint8': 'Float32Array',  # Shorter integers, loaded as floats.
         'uint16': 'Uint16Array',
         'uint32': 'Uint32Array',
         'uint64': 'Uint32Array',  # Unsupported, casted down.
@@ -415,18 +796,22 @@ BufferGeometryLoader>`__.
         values = np.ravel(values)
 
         if 'float' in dtype:
-            dtype = (DTYPE_COLOUR if attribute == 'color' else DTYPE_POSITION)
-            values = np.around(values, np.finfo(dtype).precision)
-            values = np.nan_to_num(values)
+            dtype = DTYPE_COLOUR if attribute == 'color' else DTYPE_POSITION
+            # A single copy, in single precision unless the output dtype is
+            # wider, is rounded and cleaned up in place.
+            values = np.array(
+                values, dtype=np.promote_types(dtype, np.float32))
+            np.around(values, np.finfo(dtype).precision, out=values)
+            np.nan_to_num(values, copy=False)
             dtype = np.dtype(dtype).name
 
         data['data']['attributes'][attribute] = {
             'itemSize': shape[-1],
             'type': data_types_conversion[dtype],
-            'array': values.tolist()
+            'array': values
         }
 
-    return json.dumps(data)
+    return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
 
 
 def conform_primitive_dtype(primitive):
@@ -455,6 +840,133 @@ def conform_primitive_dtype(primitive):
     )
 
 
+@lru_cache(maxsize=8)
+def _primitive_cube(segments):
+    """
+    Returns a cube primitive with given segments count conformed to the
+    required dtype, the result is cached and must not be modified.
+
+    The vertices structured array is split into a *dict* of contiguous arrays
+    per field so that the attributes are read without strided access.
+
+    Parameters
+    ----------
+    segments : int
+        Width, height and depth segments count.
+
+    Returns
+    -------
+    tuple
+        Conformed cube primitive vertices fields, faces and outline as
+        read-only arrays.
+    """
+
+    vertices, faces, outline = conform_primitive_dtype(
+        primitive_cube(
+            width_segments=segments,
+            height_segments=segments,
+            depth_segments=segments))
+
+    vertices = {
+        field: np.ascontiguousarray(vertices[field])
+        for field in vertices.dtype.names
+    }
+
+    for array in list(vertices.values()) + [faces, outline]:
+        array.setflags(write=False)
+
+    return vertices, faces, outline
+
+
+def _RGB_to_RGB(RGB, input_colourspace, output_colourspace):
+    """
+    Converts from given input RGB colourspace to output RGB colourspace.
+
+    Contrary to *colour.RGB_to_RGB* definition, the conversion matrix is
+    applied with a *BLAS* backed matrix multiplication rather than
+    *np.einsum*, which matters for full resolution images. The values are
+    converted in single precision, unless they are wider, as they are only
+    tested against the gamut boundaries.
+
+    Parameters
+    ----------
+    RGB : array_like
+        RGB colourspace values.
+    input_colourspace : RGB_Colourspace
+        RGB input colourspace.
+    output_colourspace : RGB_Colourspace
+        RGB output colourspace.
+
+    Returns
+    -------
+    ndarray
+        RGB output colourspace values.
+    """
+
+    RGB = np.asarray(RGB)
+    dtype = np.promote_types(RGB.dtype, np.float32)
+
+    return np.dot(
+        RGB.astype(dtype, copy=False),
+        matrix_RGB_to_RGB(input_colourspace,
+                          output_colourspace).T.astype(dtype))
+
+
+def _out_of_gamut_mask(RGB):
+    """
+    Returns the out of gamut mask of given RGB array, i.e. an array of the
+    same shape and type where pixels with any component outside domain [0, 1]
+    are set to 1 and other pixels to 0.
+
+    Parameters
+    ----------
+    RGB : array_like
+        RGB array.
+
+    Returns
+    -------
+    ndarray
+        Out of gamut mask.
+    """
+
+    # The single precision values are not promoted to double precision.
+    RGB = np.asarray(RGB)
+    RGB = RGB.astype(np.promote_types(RGB.dtype, np.float32), copy=False)
+
+    in_domain = RGB >= 0
+    np.logical_and(in_domain, RGB <= 1, out=in_domain)
+    out_of_gamut = ~np.all(in_domain, axis=-1)
+
+    return np.broadcast_to(out_of_gamut[..., np.newaxis],
+                           RGB.shape).astype(RGB.dtype)
+
+
+def _out_of_pointer_gamut(RGB, colourspace):
+    """
+    Returns whether given RGB colourspace values are out of *Pointer's Gamut*.
+
+    This is the test shared by `image_data` and `RGB_image_scatter_visual`
+    definitions. The RGB colourspace and *CIE XYZ* whitepoints are the same,
+    thus no chromatic adaptation is required.
+
+    Parameters
+    ----------
+    RGB : array_like
+        RGB colourspace values.
+    colourspace : RGB_Colourspace
+        RGB colourspace of the values.
+
+    Returns
+    -------
+    ndarray
+        Boolean array, *True* where the values are out of *Pointer's Gamut*.
+    """
+
+    XYZ = np.dot(as_float_array(RGB), colourspace.matrix_RGB_to_XYZ.T)
+
+    return ~np.asarray(is_within_pointer_gamut(XYZ), dtype=np.bool_)
+
+
 def image_data(path,
                primary_colourspace=PRIMARY_COLOURSPACE,
                secondary_colourspace=SECONDARY_COLOURSPACE,
@@ -497,14 +1009,12 @@ def image_data(path,
 
     Returns
     -------
-    unicode
+    bytes
         RGB image data or its out of gamut values formatted as *JSON*.
     """
 
-    primary_colourspace = first_item(
-        filter_RGB_colourspaces(re.escape(primary_colourspace)).values())
-    secondary_colourspace = first_item(
-        filter_RGB_colourspaces(re.escape(secondary_colourspace)).values())
+    primary_colourspace = _RGB_colourspace(primary_colourspace)
+    secondary_colourspace = _RGB_colourspace(secondary_colourspace)
 
     colourspace = (primary_colourspace if image_colourspace == 'Primary' else
                    secondary_colourspace)
@@ -516,41 +1026,40 @@ def image_data(path,
 
     if out_of_primary_colourspace_gamut:
         if image_colourspace == 'Secondary':
-            RGB = RGB_to_RGB(RGB, secondary_colourspace, primary_colourspace)
+            RGB = _RGB_to_RGB(RGB, secondary_colourspace, primary_colourspace)
 
-        RGB[np.logical_and(RGB >= 0, RGB <= 1)] = 0
-        RGB[RGB != 0] = 1
-        RGB[np.any(RGB == 1, axis=-1)] = 1
+        RGB = _out_of_gamut_mask(RGB)
 
     if out_of_secondary_colourspace_gamut:
         if image_colourspace == 'Primary':
-            RGB = RGB_to_RGB(RGB, primary_colourspace, secondary_colourspace)
+            RGB = _RGB_to_RGB(RGB, primary_colourspace, secondary_colourspace)
 
-        RGB[np.logical_and(RGB >= 0, RGB <= 1)] = 0
-        RGB[RGB != 0] = 1
-        RGB[np.any(RGB == 1, axis=-1)] = 1
+        RGB = _out_of_gamut_mask(RGB)
 
     if out_of_pointer_gamut:
-        O_PG = is_within_pointer_gamut(
-            RGB_to_XYZ(
-                RGB,
-                colourspace.whitepoint,
-                colourspace.whitepoint,
-                colourspace.matrix_RGB_to_XYZ,
-            )).astype(np.int_)
-        O_PG = 1 - O_PG
-        RGB[O_PG != 1] = 0
-        RGB[O_PG == 1] = 1
+        O_PG = _out_of_pointer_gamut(RGB, colourspace)
+        RGB = np.broadcast_to(O_PG[..., np.newaxis],
+                              RGB.shape).astype(RGB.dtype)
 
     shape = RGB.shape
-    RGB = np.ravel(RGB[..., 0:3].reshape(-1, 3))
-    RGB = np.around(RGB, np.finfo(DTYPE_COLOUR).precision)
 
-    return json.dumps({
-        'width': shape[1],
-        'height': shape[0],
-        'data': RGB.tolist()
-    })
+    # Single precision is enough to represent the rounded values, unless the
+    # output dtype is wider.
+    dtype = np.promote_types(DTYPE_COLOUR, np.float32)
+    RGB = np.asarray(RGB[..., 0:3], dtype=dtype).reshape(-1)
+
+    # The out of gamut masks are exactly 0 or 1 and do not need rounding.
+    if not (out_of_primary_colourspace_gamut or
+            out_of_secondary_colourspace_gamut or out_of_pointer_gamut):
+        RGB = np.around(RGB, np.finfo(DTYPE_COLOUR).precision)
+
+    return orjson.dumps(
+        {
+            'width': shape[1],
+            'height': shape[0],
+            'data': RGB
+        },
+        option=orjson.OPT_SERIALIZE_NUMPY)
 
 
 def RGB_colourspace_volume_visual(colourspace=PRIMARY_COLOURSPACE,
@@ -574,38 +1083,36 @@ def RGB_colourspace_volume_visual(colourspace=PRIMARY_COLOURSPACE,
 
     Returns
     -------
-    unicode
+    bytes
         RGB colourspace volume visual geometry formatted as *JSON*.
     """
 
-    colourspace = first_item(
-        filter_RGB_colourspaces(re.escape(colourspace)).values())
+    # The geometry does not depend on "wireframe", the client only changes the
+    # material accordingly.
+    key = 'RGB_colourspace_volume_visual-{0}-{1}-{2}'.format(
+        colourspace, colourspace_model, segments)
 
-    cube = conform_primitive_dtype(
-        primitive_cube(
-            width_segments=segments,
-            height_segments=segments,
-            depth_segments=segments))
+    json_data = VISUAL_CACHE.get(key)
+    if json_data is not None:
+        return json_data
+
+    colourspace = _RGB_colourspace(colourspace)
+
+    cube = _primitive_cube(segments)
 
     vertices = cube[0]['position'] + 0.5
     faces = colourspace_model_faces_reorder(
         np.reshape(cube[1], (-1, 1)), colourspace_model)
     RGB = cube[0]['colour']
 
-    XYZ = RGB_to_XYZ(
-        vertices,
-        colourspace.whitepoint,
-        colourspace.whitepoint,
-        colourspace.matrix_RGB_to_XYZ,
-    )
-    vertices = colourspace_model_axis_reorder(
-        XYZ_to_colourspace_model(
-            XYZ,
-            colourspace.whitepoint,
-            colourspace_model,
-        ), colourspace_model)
+    vertices = RGB_to_colourspace_model(
+        vertices, colourspace, colourspace_model, reorder_axes=True)
+
+    json_data = buffer_geometry(position=vertices, color=RGB, index=faces)
+
+    VISUAL_CACHE.set(key, json_data)
 
-    return buffer_geometry(position=vertices, color=RGB, index=faces)
+    return json_data
 
 
 def RGB_image_scatter_visual(path,
@@ -658,69 +1165,43 @@ def RGB_image_scatter_visual(path,
 
     Returns
     -------
-    unicode
+    bytes
         RGB image scatter visual geometry formatted as *JSON*.
     """
 
-    primary_colourspace = first_item(
-        filter_RGB_colourspaces(re.escape(primary_colourspace)).values())
-    secondary_colourspace = first_item(
-        filter_RGB_colourspaces(re.escape(secondary_colourspace)).values())
+    primary_colourspace = _RGB_colourspace(primary_colourspace)
+    secondary_colourspace = _RGB_colourspace(secondary_colourspace)
 
     colourspace = (primary_colourspace if image_colourspace == 'Primary' else
                    secondary_colourspace)
 
-    RGB = load_image(path, image_decoding_cctf)
+    RGB = load_image(path, image_decoding_cctf, sub_sampling)
 
     if saturate:
         RGB = np.clip(RGB, 0, 1)
 
-    RGB = RGB[..., 0:3].reshape(-1, 3)[::sub_sampling]
-
     if out_of_primary_colourspace_gamut:
-        RGB_c = np.copy(RGB)
-
-        if image_colourspace == 'Secondary':
-            RGB_c = RGB_to_RGB(RGB, secondary_colourspace, primary_colourspace)
+        RGB_c = (_RGB_to_RGB(RGB, secondary_colourspace, primary_colourspace)
+                 if image_colourspace == 'Secondary' else RGB)
 
         RGB = RGB[np.any(np.logical_or(RGB_c < 0, RGB_c > 1), axis=-1)]
 
     if out_of_secondary_colourspace_gamut:
-        RGB_c = np.copy(RGB)
-
-        if image_colourspace == 'Primary':
-            RGB_c = RGB_to_RGB(RGB, primary_colourspace, secondary_colourspace)
+        RGB_c = (_RGB_to_RGB(RGB, primary_colourspace, secondary_colourspace)
+                 if image_colourspace == 'Primary' else RGB)
 
         RGB = RGB[np.any(np.logical_or(RGB_c < 0, RGB_c > 1), axis=-1)]
 
     if out_of_pointer_gamut:
-        O_PG = is_within_pointer_gamut(
-            RGB_to_XYZ(
-                RGB,
-                colourspace.whitepoint,
-                colourspace.whitepoint,
-                colourspace.matrix_RGB_to_XYZ,
-            )).astype(np.int_)
-        O_PG = 1 - O_PG
-        RGB = RGB[O_PG == 1]
-
-    XYZ = RGB_to_XYZ(
-        RGB,
-        colourspace.whitepoint,
-        colourspace.whitepoint,
-        colourspace.matrix_RGB_to_XYZ,
-    )
+        RGB = RGB[_out_of_pointer_gamut(RGB, colourspace)]
 
-    vertices = colourspace_model_axis_reorder(
-        XYZ_to_colourspace_model(
-            XYZ,
-            colourspace.whitepoint,
-            colourspace_model,
-        ), colourspace_model)
+    vertices = RGB_to_colourspace_model(
+        RGB, colourspace, colourspace_model, reorder_axes=True)
 
     if (out_of_primary_colourspace_gamut or
             out_of_secondary_colourspace_gamut or out_of_pointer_gamut):
-        RGB = np.ones(RGB.shape)
+        # A single byte per component, serialised as the shorter integer 1.
+        RGB = np.ones(RGB.shape, np.uint8)
 
     return buffer_geometry(position=vertices, color=RGB)
 
@@ -743,35 +1224,37 @@ def spectral_locus_visual(colourspace=PRIMARY_COLOURSPACE,
 
     Returns
     -------
-    unicode
+    bytes
         Spectral locus visual geometry formatted as *JSON*.
     """
 
-    colourspace = first_item(
-        filter_RGB_colourspaces(re.escape(colourspace)).values())
+    key = 'spectral_locus_visual-{0}-{1}-{2}'.format(
+        colourspace, colourspace_model, cmfs)
+
+    json_data = VISUAL_CACHE.get(key)
+    if json_data is not None:
+        return json_data
 
-    cmfs = first_item(filter_cmfs(cmfs).values())
+    colourspace = _RGB_colourspace(colourspace)
+
+    cmfs = _cmfs(cmfs)
     XYZ = cmfs.values
 
     XYZ = np.vstack([XYZ, XYZ[0, ...]])
 
-    vertices = colourspace_model_axis_reorder(
-        XYZ_to_colourspace_model(
-            XYZ,
-            colourspace.whitepoint,
-            colourspace_model,
-        ), colourspace_model)
+    vertices = XYZ_to_colourspace_model(
+        XYZ, colourspace.whitepoint, colourspace_model, reorder_axes=True)
 
+    # The CIE XYZ and RGB colourspace whitepoints are the same, thus no
+    # chromatic adaptation is required.
     RGB = normalise_maximum(
-        XYZ_to_RGB(
-            XYZ,
-            colourspace.whitepoint,
-            colourspace.whitepoint,
-            colourspace.matrix_XYZ_to_RGB,
-        ),
-        axis=-1)
+        np.dot(XYZ, colourspace.matrix_XYZ_to_RGB.T), axis=-1)
 
-    return buffer_geometry(position=vertices, color=RGB)
+    json_data = buffer_geometry(position=vertices, color=RGB)
+
+    VISUAL_CACHE.set(key, json_data)
+
+    return json_data
 
 
 def pointer_gamut_visual(colourspace_model='CIE xyY'):
@@ -785,28 +1268,41 @@ def pointer_gamut_visual(colourspace_model='CIE xyY'):
 
     Returns
     -------
-    unicode
+    bytes
         *Pointer's Gamut* visual geometry formatted as *JSON*.
     """
 
     data_pointer_gamut = np.reshape(DATA_POINTER_GAMUT, (16, -1, 3))
-    vertices = []
-    for i in range(16):
-        section = colourspace_model_axis_reorder(
-            XYZ_to_colourspace_model(
-                np.vstack(
-                    [data_pointer_gamut[i], data_pointer_gamut[i][0, ...]]),
-                CCS_ILLUMINANT_POINTER_GAMUT,
-                colourspace_model,
-            ), colourspace_model)
-
-        vertices.append(list(zip(section, section[1:])))
+    sections = XYZ_to_colourspace_model(
+        np.concatenate(
+            [data_pointer_gamut, data_pointer_gamut[:, 0:1, ...]], axis=1),
+        CCS_ILLUMINANT_POINTER_GAMUT,
+        colourspace_model,
+        reorder_axes=True)
 
-    vertices = as_float_array(vertices)
+    vertices = np.stack([sections[:, :-1, ...], sections[:, 1:, ...]], axis=-2)
 
     return buffer_geometry(position=vertices)
 
 
+@lru_cache(maxsize=1)
+def _XYZ_outer_surface():
+    """
+    Returns the *CIE XYZ* colourspace outer surface, the result is cached and
+    must not be modified.
+
+    Returns
+    -------
+    ndarray
+        Read-only *CIE XYZ* colourspace outer surface.
+    """
+
+    XYZ = np.copy(XYZ_outer_surface())
+    XYZ.setflags(write=False)
+
+    return XYZ
+
+
 def visible_spectrum_visual(colourspace_model='CIE xyY'):
     """
     Returns the visible spectrum visual geometry formatted as *JSON*.
@@ -818,18 +1314,17 @@ def visible_spectrum_visual(colourspace_model='CIE xyY'):
 
     Returns
     -------
-    unicode
+    bytes
         Visible spectrum visual geometry formatted as *JSON*.
     """
 
-    XYZ = XYZ_outer_surface()
-    vertices = colourspace_model_axis_reorder(
-        XYZ_to_colourspace_model(
-            XYZ,
-            CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['E'],
-            colourspace_model,
-        ), colourspace_model)
+    XYZ = _XYZ_outer_surface()
+    vertices = XYZ_to_colourspace_model(
+        XYZ,
+        CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['E'],
+        colourspace_model,
+        reorder_axes=True)
 
-    vertices = as_float_array(list(zip(vertices, vertices[1:])))
+    vertices = np.stack([vertices[:-1, ...], vertices[1:, ...]], axis=1)
 
     return buffer_geometry(position=vertices)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Gunicorn Configuration
+======================
+
+Defines the *Gunicorn* settings and server hooks, the configuration file is
+loaded from the working directory by default.
+"""
+
+import subprocess
+import sys
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2018-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['preload_app', 'when_ready']
+
+preload_app = True
+"""
+Whether to import the application in the master process before forking the
+workers. Importing *Colour*, which imports *Matplotlib*, and the module level
+data is slow and memory hungry, the workers share the imported modules pages
+copy-on-write rather than each importing them.
+
+preload_app : bool
+"""
+
+
+def when_ready(server):
+    """
+    Pre-warms the caches once when the server is ready.
+
+    The caches are pre-warmed in a separate process so that neither the master
+    nor the workers event loop and heartbeat are blocked. The responses are
+    only pre-warmed when the *REDIS_URL* environment variable is defined as
+    the in-memory responses cache of the separate process is otherwise lost,
+    the decoded images cache, which is shared on disk, is pre-warmed in any
+    case.
+
+    Parameters
+    ----------
+    server : Arbiter
+        *Gunicorn* arbiter.
+    """
+
+    server.log.info('Pre-warming the caches...')
+
+    subprocess.Popen([
+        sys.executable, '-c',
+        'from app import REDIS_URL, prewarm_cache; '
+        'prewarm_cache(REDIS_URL is not None)'
+    ])
@@ -8,8 +8,9 @@ import fileinput
 import re
 import sys
 from invoke import task
-from invoke.exceptions import Failure
+from invoke.exceptions import Exit, Failure
 
+from colour import RGB_COLOURSPACES
 from colour.utilities import message_box
 
 import app
@@ -23,7 +24,8 @@ __status__ = 'Production'
 
 __all__ = [
     'APPLICATION_NAME', 'ORG', 'CONTAINER', 'clean', 'quality', 'formatting',
-    'npm_build', 'requirements', 'docker_build', 'docker_remove', 'docker_run'
+    'npm_build', 'requirements', 'precompute', 'docker_build', 'docker_remove',
+    'docker_run'
 ]
 
 APPLICATION_NAME = app.__application_name__
@@ -159,6 +161,43 @@ def requirements(ctx):
             '> requirements.txt')
 
 
+@task
+def precompute(ctx, all_colourspaces=False):
+    """
+    Precomputes the RGB colourspace volume visuals and the default responses
+    into the shared *Redis* responses cache defined by the *REDIS_URL*
+    environment variable.
+
+    Parameters
+    ----------
+    ctx : invoke.context.Context
+        Context.
+    all_colourspaces : bool, optional
+        Whether to precompute the visuals for all the RGB colourspaces rather
+        than only the primary and secondary ones.
+
+    Returns
+    -------
+    bool
+        Task success.
+    """
+
+    if app.REDIS_URL is None:
+        raise Exit('The "REDIS_URL" environment variable must be defined!')
+
+    message_box('Precomputing RGB colourspace volume visuals...')
+    if all_colourspaces:
+        count = app.precompute_RGB_colourspace_volume_visuals(
+            colourspaces=sorted(RGB_COLOURSPACES.keys()))
+    else:
+        count = app.precompute_RGB_colourspace_volume_visuals()
+
+    message_box('{0} visuals were precomputed.'.format(count))
+
+    message_box('Pre-warming the default responses...')
+    app.prewarm_cache()
+
+
 @task(npm_build, requirements)
 def docker_build(ctx):
     """
@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+"""
+Defines the unit tests for the :mod:`app` module.
+"""
+
+import orjson
+import unittest
+from werkzeug.datastructures import MultiDict
+from werkzeug.exceptions import BadRequest
+
+from app import (APP, CACHE, IMAGE_DATA_ARGUMENTS,
+                 RGB_COLOURSPACE_VOLUME_VISUAL_ARGUMENTS,
+                 RGB_IMAGE_SCATTER_VISUAL_ARGUMENTS, _cache_key,
+                 _image_data_key_arguments, _parse_args)
+from colour_analysis import (COLOURSPACE_MODEL, IMAGE_CCTF_DECODING,
+                             PRIMARY_COLOURSPACE, cctf_decodings)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2018-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'TestParseArgs', 'TestCacheKey', 'TestCompressedResponse',
+    'TestPrecomputedResponse', 'TestBeforeRequest'
+]
+
+
+class TestParseArgs(unittest.TestCase):
+    """
+    Defines :func:`app._parse_args` definition unit tests methods.
+    """
+
+    def test_parse_args(self):
+        """
+        Tests :func:`app._parse_args` definition.
+        """
+
+        self.assertDictEqual(
+            _parse_args(MultiDict(), RGB_COLOURSPACE_VOLUME_VISUAL_ARGUMENTS),
+            {
+                'colourspace': PRIMARY_COLOURSPACE,
+                'colourspace_model': COLOURSPACE_MODEL,
+                'segments': 16,
+                'wireframe': False,
+            })
+
+        self.assertDictEqual(
+            _parse_args(
+                MultiDict([
+                    ('colourspace', 'DCI-P3'),
+                    ('colourspaceModel', 'CIE Lab'),
+                    ('segments', '8'),
+                    ('wireframe', 'true'),
+                    ('unknown', 'argument'),
+                ]), RGB_COLOURSPACE_VOLUME_VISUAL_ARGUMENTS), {
+                    'colourspace': 'DCI-P3',
+                    'colourspace_model': 'CIE Lab',
+                    'segments': 8,
+                    'wireframe': True,
+                })
+
+        arguments = _parse_args(
+            MultiDict([('saturate', 'true'), ('subSampling', '4')]),
+            RGB_IMAGE_SCATTER_VISUAL_ARGUMENTS)
+        self.assertIs(arguments['saturate'], True)
+        self.assertIs(arguments['out_of_pointer_gamut'], False)
+        self.assertEqual(arguments['sub_sampling'], 4)
+        self.assertEqual(arguments['image_decoding_cctf'], IMAGE_CCTF_DECODING)
+
+    def test_raise_exception_parse_args(self):
+        """
+        Tests :func:`app._parse_args` definition raised exception.
+        """
+
+        self.assertRaises(BadRequest, _parse_args,
+                          MultiDict([('segments', 'sixteen')]),
+                          RGB_COLOURSPACE_VOLUME_VISUAL_ARGUMENTS)
+
+        with APP.test_client() as client:
+            response = client.get(
+                '/RGB-colourspace-volume-visual?segments=sixteen')
+
+            self.assertEqual(response.status_code, 400)
+
+
+class TestCacheKey(unittest.TestCase):
+    """
+    Defines :func:`app._cache_key` definition unit tests methods.
+    """
+
+    def test_cache_key(self):
+        """
+        Tests :func:`app._cache_key` definition.
+        """
+
+        query = [
+            ('colourspace', 'DCI-P3'),
+            ('colourspaceModel', 'CIE Lab'),
+            ('segments', '8'),
+            ('wireframe', 'true'),
+        ]
+
+        self.assertEqual(
+            _cache_key(
+                '/RGB-colourspace-volume-visual',
+                _parse_args(
+                    MultiDict(query),
+                    RGB_COLOURSPACE_VOLUME_VISUAL_ARGUMENTS)),
+            _cache_key(
+                '/RGB-colourspace-volume-visual',
+                _parse_args(
+                    MultiDict(reversed(query)),
+                    RGB_COLOURSPACE_VOLUME_VISUAL_ARGUMENTS)))
+
+        # The default values are equivalent to the omitted arguments.
+        self.assertEqual(
+            _cache_key(
+                '/RGB-colourspace-volume-visual',
+                _parse_args(
+                    MultiDict([('segments', '16')]),
+                    RGB_COLOURSPACE_VOLUME_VISUAL_ARGUMENTS)),
+            _cache_key(
+                '/RGB-colourspace-volume-visual',
+                _parse_args(MultiDict(),
+                            RGB_COLOURSPACE_VOLUME_VISUAL_ARGUMENTS)))
+
+        self.assertNotEqual(
+            _cache_key(
+                '/RGB-colourspace-volume-visual',
+                _parse_args(
+                    MultiDict([('segments', '8')]),
+                    RGB_COLOURSPACE_VOLUME_VISUAL_ARGUMENTS)),
+            _cache_key(
+                '/RGB-colourspace-volume-visual',
+                _parse_args(MultiDict(),
+                            RGB_COLOURSPACE_VOLUME_VISUAL_ARGUMENTS)))
+
+    def test_image_data_cache_key(self):
+        """
+        Tests :func:`app._cache_key` definition with the image data arguments
+        affecting the response.
+        """
+
+        image = 'Rose.ProPhoto.jpg'
+
+        # The colourspaces do not affect the response without gamut tests.
+        self.assertEqual(
+            _cache_key(
+                '/image-data/{0}'.format(image),
+                _image_data_key_arguments(
+                    _parse_args(
+                        MultiDict([('primaryColourspace', 'DCI-P3')]),
+                        IMAGE_DATA_ARGUMENTS), image)),
+            _cache_key(
+                '/image-data/{0}'.format(image),
+                _image_data_key_arguments(
+                    _parse_args(MultiDict(), IMAGE_DATA_ARGUMENTS), image)))
+
+        self.assertNotEqual(
+            _cache_key(
+                '/image-data/{0}'.format(image),
+                _image_data_key_arguments(
+                    _parse_args(
+                        MultiDict([('primaryColourspace', 'DCI-P3'),
+                                   ('outOfPrimaryColourspaceGamut', 'true')]),
+                        IMAGE_DATA_ARGUMENTS), image)),
+            _cache_key(
+                '/image-data/{0}'.format(image),
+                _image_data_key_arguments(
+                    _parse_args(
+                        MultiDict([('outOfPrimaryColourspaceGamut', 'true')]),
+                        IMAGE_DATA_ARGUMENTS), image)))
+
+
+class TestCompressedResponse(unittest.TestCase):
+    """
+    Defines :func:`app._compressed_response` definition unit tests methods.
+    """
+
+    def test_compressed_response(self):
+        """
+        Tests :func:`app._compressed_response` definition.
+        """
+
+        with APP.test_client() as client:
+            for accept_encoding, content_encoding in (
+                ('gzip', 'gzip'),
+                ('deflate, gzip;q=0.5', 'gzip'),
+                ('*', 'gzip'),
+                ('identity', None),
+                ('gzip;q=0, identity', None),
+            ):
+                response = client.get(
+                    '/spectral-locus-visual',
+                    headers={'Accept-Encoding': accept_encoding})
+
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    response.headers.get('Content-Encoding'),
+                    content_encoding, accept_encoding)
+
+
+class TestPrecomputedResponse(unittest.TestCase):
+    """
+    Defines :func:`app._precomputed_response` definition unit tests methods.
+    """
+
+    def test_precomputed_response(self):
+        """
+        Tests :func:`app._precomputed_response` definition.
+        """
+
+        with APP.test_client() as client:
+            response = client.get(
+                '/decoding-cctfs', headers={'Accept-Encoding': 'gzip'})
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+            self.assertEqual(response.headers['Vary'], 'Accept-Encoding')
+            self.assertIn('immutable', response.headers['Cache-Control'])
+
+    def test_identity_precomputed_response(self):
+        """
+        Tests :func:`app._precomputed_response` definition streamed response
+        to the clients not accepting the *gzip* encoding.
+        """
+
+        with APP.test_client() as client:
+            response = client.get(
+                '/decoding-cctfs', headers={'Accept-Encoding': 'identity'})
+
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('Content-Encoding', response.headers)
+            self.assertEqual(response.headers['Vary'], 'Accept-Encoding')
+            self.assertEqual(
+                orjson.loads(response.get_data()),
+                orjson.loads(cctf_decodings()))
+            self.assertEqual(
+                int(response.headers['X-Content-Length']),
+                len(response.get_data()))
+
+
+class TestBeforeRequest(unittest.TestCase):
+    """
+    Defines :func:`app.before_request` definition unit tests methods.
+    """
+
+    def test_before_request(self):
+        """
+        Tests :func:`app.before_request` definition.
+        """
+
+        url = '/RGB-colourspace-volume-visual?segments=4'
+
+        with APP.test_client() as client:
+            response = client.get(url, headers={'Accept-Encoding': 'gzip'})
+
+            self.assertEqual(response.status_code, 200)
+            etag = response.headers['ETag']
+
+            # The view is not called, the evicted response is not recomputed.
+            CACHE.clear()
+            response = client.get(
+                url,
+                headers={
+                    'If-None-Match': etag,
+                    'Accept-Encoding': 'gzip'
+                })
+
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.headers['ETag'], etag)
+            self.assertEqual(response.get_data(), b'')
+            self.assertIsNone(
+                CACHE.get(
+                    _cache_key(
+                        '/RGB-colourspace-volume-visual',
+                        _parse_args(
+                            MultiDict([('segments', '4')]),
+                            RGB_COLOURSPACE_VOLUME_VISUAL_ARGUMENTS))))
+
+            # The *ETag* depends on the negotiated encoding.
+            response = client.get(
+                url,
+                headers={
+                    'If-None-Match': etag,
+                    'Accept-Encoding': 'identity'
+                })
+
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response.headers['ETag'], etag)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+"""
+Defines the unit tests for the :mod:`colour_analysis` module.
+"""
+
+import numpy as np
+import orjson
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour import CCTF_DECODINGS, RGB_COLOURSPACES, RGB_to_RGB, convert
+from colour.graph.conversion import CONVERSION_GRAPH_NODE_LABELS
+
+import colour_analysis
+from colour_analysis import (
+    COLOURSPACE_MODELS, COLOURSPACE_MODELS_NORMALISATION_FACTORS, DTYPE_COLOUR,
+    DTYPE_POSITION, RGB_to_colourspace_model, buffer_geometry,
+    colourspace_model_axis_reorder, _decoding_LUT, _out_of_gamut_mask,
+    _RGB_to_RGB, load_image)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2018-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'TestLoadImage', 'TestDecodingLUT', 'TestRGB_to_colourspace_model',
+    'TestOutOfGamutMask', 'TestBufferGeometry'
+]
+
+
+class TestLoadImage(unittest.TestCase):
+    """
+    Defines :func:`colour_analysis.load_image` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._image_cache_directory = colour_analysis.IMAGE_CACHE_DIRECTORY
+        colour_analysis.IMAGE_CACHE_DIRECTORY = os.path.join(
+            self._temporary_directory, 'cache')
+
+        self._path = os.path.join(self._temporary_directory, 'Image.jpg')
+        shutil.copyfile(
+            os.path.join(
+                os.path.dirname(__file__), '..', 'static', 'images',
+                'Rose.ProPhoto.jpg'), self._path)
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        colour_analysis.IMAGE_CACHE_DIRECTORY = self._image_cache_directory
+
+        shutil.rmtree(self._temporary_directory)
+
+    def _cached_images_count(self):
+        """
+        Returns the count of the cached images.
+        """
+
+        return len(os.listdir(colour_analysis.IMAGE_CACHE_DIRECTORY))
+
+    def test_load_image(self):
+        """
+        Tests :func:`colour_analysis.load_image` definition.
+        """
+
+        RGB = load_image(self._path)
+
+        self.assertEqual(RGB.dtype, np.float32)
+        self.assertEqual(self._cached_images_count(), 1)
+
+        # The cached image is memory-mapped.
+        np.testing.assert_equal(load_image(self._path), RGB)
+        self.assertIsInstance(load_image(self._path), np.memmap)
+
+        RGB_s = load_image(self._path, sub_sampling=25)
+
+        self.assertTrue(RGB_s.flags.c_contiguous)
+        np.testing.assert_equal(RGB_s, RGB[..., 0:3].reshape(-1, 3)[::25])
+
+        # The sub-sampled images are not cached.
+        self.assertEqual(self._cached_images_count(), 1)
+
+        load_image(self._path, 'Gamma 2.2')
+        self.assertEqual(self._cached_images_count(), 2)
+
+        # The cached images of a previous modification time are deleted.
+        stat = os.stat(self._path)
+        os.utime(
+            self._path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        load_image(self._path)
+        self.assertEqual(self._cached_images_count(), 2)
+
+
+class TestDecodingLUT(unittest.TestCase):
+    """
+    Defines :func:`colour_analysis._decoding_LUT` definition unit tests
+    methods.
+    """
+
+    def test_decoding_LUT(self):
+        """
+        Tests :func:`colour_analysis._decoding_LUT` definition.
+        """
+
+        code_values = np.array([0, 1, 255, 257, 4096, 32768, 65534, 65535])
+
+        for decoding_cctf in ('sRGB', 'Gamma 2.2', 'Linear', 'ST 2084'):
+            LUT = _decoding_LUT(decoding_cctf)
+
+            self.assertEqual(LUT.shape, (65536, ))
+            self.assertEqual(LUT.dtype, np.float32)
+            self.assertFalse(LUT.flags.writeable)
+
+            np.testing.assert_allclose(
+                np.take(LUT, code_values),
+                CCTF_DECODINGS[decoding_cctf](code_values / 65535),
+                rtol=1e-6,
+                atol=1e-7)
+
+        self.assertIs(_decoding_LUT('sRGB'), _decoding_LUT('sRGB'))
+
+
+class TestRGB_to_colourspace_model(unittest.TestCase):
+    """
+    Defines :func:`colour_analysis.RGB_to_colourspace_model` definition unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._colourspace = RGB_COLOURSPACES['sRGB']
+        self._RGB = np.random.RandomState(4).uniform(0.05, 0.95, (256, 3))
+
+        XYZ = np.dot(self._RGB, self._colourspace.matrix_RGB_to_XYZ.T)
+
+        self._references = {}
+        for model in COLOURSPACE_MODELS:
+            # *CIE XYZ* is the source of the conversion graph.
+            if model == 'CIE XYZ':
+                reference = np.copy(XYZ)
+            # Some models are not nodes of the conversion graph of the
+            # installed *Colour* version.
+            elif model.lower() not in CONVERSION_GRAPH_NODE_LABELS:
+                continue
+            else:
+                reference = convert(
+                    XYZ,
+                    'CIE XYZ',
+                    model,
+                    illuminant=self._colourspace.whitepoint)
+
+            self._references[model] = reference / (
+                COLOURSPACE_MODELS_NORMALISATION_FACTORS.get(model, 1))
+
+    def test_RGB_to_colourspace_model(self):
+        """
+        Tests :func:`colour_analysis.RGB_to_colourspace_model` definition.
+        """
+
+        for model, reference in self._references.items():
+            ijk = RGB_to_colourspace_model(self._RGB, self._colourspace,
+                                           model)
+
+            self.assertEqual(ijk.shape, self._RGB.shape)
+            np.testing.assert_allclose(
+                ijk, reference, rtol=1e-5, atol=1e-6, err_msg=model)
+
+    def test_reorder_axes_RGB_to_colourspace_model(self):
+        """
+        Tests :func:`colour_analysis.RGB_to_colourspace_model` definition
+        axes reordering.
+        """
+
+        for model, reference in self._references.items():
+            np.testing.assert_allclose(
+                RGB_to_colourspace_model(
+                    self._RGB, self._colourspace, model, reorder_axes=True),
+                colourspace_model_axis_reorder(reference, model),
+                rtol=1e-5,
+                atol=1e-6,
+                err_msg=model)
+
+    def test_black_RGB_to_colourspace_model(self):
+        """
+        Tests :func:`colour_analysis.RGB_to_colourspace_model` definition
+        black values conversion to *CIE xyY* colourspace.
+        """
+
+        colourspace = RGB_COLOURSPACES['sRGB']
+
+        np.testing.assert_allclose(
+            RGB_to_colourspace_model(
+                np.zeros((2, 3)), colourspace, 'CIE xyY'),
+            np.array([
+                [colourspace.whitepoint[0], colourspace.whitepoint[1], 0],
+                [colourspace.whitepoint[0], colourspace.whitepoint[1], 0],
+            ]),
+            rtol=1e-6)
+
+    def test_single_precision_RGB_to_colourspace_model(self):
+        """
+        Tests :func:`colour_analysis.RGB_to_colourspace_model` definition
+        single precision input.
+        """
+
+        colourspace = RGB_COLOURSPACES['sRGB']
+        RGB = np.random.RandomState(8).uniform(0, 1, (256, 3))
+
+        for model in ('CIE XYZ', 'CIE UCS', 'CIE xyY'):
+            ijk = RGB_to_colourspace_model(
+                RGB.astype(np.float32), colourspace, model, True)
+
+            self.assertEqual(ijk.dtype, np.float32)
+            np.testing.assert_allclose(
+                ijk,
+                RGB_to_colourspace_model(RGB, colourspace, model, True),
+                rtol=1e-5,
+                atol=1e-6,
+                err_msg=model)
+
+
+class TestOutOfGamutMask(unittest.TestCase):
+    """
+    Defines :func:`colour_analysis._out_of_gamut_mask` definition unit tests
+    methods.
+    """
+
+    def test_out_of_gamut_mask(self):
+        """
+        Tests :func:`colour_analysis._out_of_gamut_mask` definition.
+        """
+
+        RGB = np.array([
+            [0.0, 0.5, 1.0],
+            [-0.1, 0.5, 0.5],
+            [0.5, 1.1, 0.5],
+            [np.nan, 0.5, 0.5],
+        ])
+
+        np.testing.assert_equal(
+            _out_of_gamut_mask(RGB),
+            np.array([[0, 0, 0], [1, 1, 1], [1, 1, 1], [1, 1, 1]]))
+
+        self.assertEqual(
+            _out_of_gamut_mask(RGB.astype(np.float32)).dtype, np.float32)
+
+    def test_single_precision_out_of_gamut_mask(self):
+        """
+        Tests :func:`colour_analysis._out_of_gamut_mask` definition with the
+        single precision conversion of :func:`colour_analysis._RGB_to_RGB`
+        definition against a double precision reference.
+        """
+
+        input_colourspace = RGB_COLOURSPACES['ProPhoto RGB']
+        output_colourspace = RGB_COLOURSPACES['sRGB']
+
+        RGB = np.random.RandomState(16).uniform(
+            0, 1, (64, 64, 3)).astype(np.float32)
+
+        reference = RGB_to_RGB(
+            RGB.astype(np.float64), input_colourspace, output_colourspace)
+        reference_mask = np.any((reference < 0) | (reference > 1), axis=-1)
+
+        mask = _out_of_gamut_mask(
+            _RGB_to_RGB(RGB, input_colourspace, output_colourspace))
+
+        # The values within single precision of the gamut boundaries may be
+        # classified either way.
+        is_unambiguous = np.all(
+            np.minimum(np.abs(reference), np.abs(reference - 1)) > 1e-5,
+            axis=-1)
+
+        self.assertGreater(np.sum(reference_mask), 0)
+        np.testing.assert_equal(
+            mask[..., 0].astype(np.bool_)[is_unambiguous],
+            reference_mask[is_unambiguous])
+
+
+class TestBufferGeometry(unittest.TestCase):
+    """
+    Defines :func:`colour_analysis.buffer_geometry` definition unit tests
+    methods.
+    """
+
+    def test_buffer_geometry(self):
+        """
+        Tests :func:`colour_analysis.buffer_geometry` definition.
+        """
+
+        position = np.random.RandomState(4).uniform(-1, 1, (4096, 3))
+        color = np.random.RandomState(8).uniform(0, 1, (4096, 3))
+
+        data = orjson.loads(buffer_geometry(position=position, color=color))
+        attributes = data['data']['attributes']
+
+        self.assertEqual(attributes['position']['type'], 'Float32Array')
+        self.assertEqual(attributes['position']['itemSize'], 3)
+        self.assertEqual(attributes['color']['type'], 'Float32Array')
+
+        # The values are rounded in single precision, they match the double
+        # precision rounding within one unit of the last decimal.
+        for attribute, values, dtype in (('position', position,
+                                          DTYPE_POSITION),
+                                         ('color', color, DTYPE_COLOUR)):
+            precision = np.finfo(dtype).precision
+            np.testing.assert_allclose(
+                attributes[attribute]['array'],
+                np.around(np.ravel(values), precision),
+                rtol=0,
+                atol=10 ** -precision * 1.01)
+
+    def test_integer_buffer_geometry(self):
+        """
+        Tests :func:`colour_analysis.buffer_geometry` definition integer
+        colours support.
+        """
+
+        json_data = buffer_geometry(color=np.ones((4, 3), np.uint8))
+        color = orjson.loads(json_data)['data']['attributes']['color']
+
+        self.assertEqual(color['type'], 'Float32Array')
+        self.assertListEqual(color['array'], [1] * 12)
+        self.assertIn(b'[1,1,1,1', json_data)
+
+    def test_nan_buffer_geometry(self):
+        """
+        Tests :func:`colour_analysis.buffer_geometry` definition nan support.
+        """
+
+        data = orjson.loads(
+            buffer_geometry(position=np.array([[np.nan, np.inf, 0.5]])))
+        position = data['data']['attributes']['position']['array']
+
+        self.assertTrue(np.all(np.isfinite(position)))
+
+
+if __name__ == '__main__':
+    unittest.main()
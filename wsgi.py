@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+WSGI
+====
+
+Defines the *WSGI* entry point used to serve the application with *Gunicorn*
+and *gevent* workers, e.g.:
+
+    gunicorn -k gevent -w $(nproc) --worker-connections 1000 \
+-b 0.0.0.0:5000 wsgi:application
+
+The caches are pre-warmed once by the *Gunicorn* server hook defined in the
+*gunicorn.conf.py* configuration file rather than by every worker.
+"""
+
+from gevent import monkey
+
+monkey.patch_all()
+
+from app import APP  # noqa
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2018-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['application']
+
+application = APP
+"""
+*WSGI* application.
+
+application : Flask
+"""